@@ -55,6 +55,17 @@ GO_MODULE_NAME = "kaizen"
 MAX_FIX_ITERATIONS = 8
 SESSION_FILE = Path(__file__).parent / "py_to_go.kaizen"
 
+# Patterns used on every fix-loop iteration, compiled once at import time.
+# Go compiler errors (file.go:line:col: message)
+_WALRUS_ERROR_RE = re.compile(r'(\S+\.go):(\d+):\d+:\s*no new variables on left side of :=')
+_UNUSED_IMPORT_RE = re.compile(r'(\S+\.go):(\d+):\d+:\s*"([^"]+)"\s+imported and not used')
+_UNDEFINED_NAME_RE = re.compile(r'(\S+\.go):\d+:\d+:\s*undefined:\s*(\w+)')
+# Go source cleanup
+_EMPTY_IMPORT_BLOCK_RE = re.compile(r'import\s*\(\s*\)')
+_EXTRA_BLANK_LINES_RE = re.compile(r'\n{3,}')
+_IMPORT_BLOCK_START_RE = re.compile(r'(import\s*\()')
+_PACKAGE_LINE_RE = re.compile(r'(package\s+\w+\s*\n)')
+
 
 def print_banner(text: str) -> None:
     """Print a formatted banner."""
@@ -298,9 +309,9 @@ def _strip_self_imports(go_code: str, package_name: str) -> str:
 
     # Clean up empty import blocks: import (\n)
     result = "\n".join(filtered)
-    result = re.sub(r'import\s*\(\s*\)', '', result)
+    result = _EMPTY_IMPORT_BLOCK_RE.sub('', result)
     # Remove leftover blank lines from removed imports (collapse triple+ newlines)
-    result = re.sub(r'\n{3,}', '\n\n', result)
+    result = _EXTRA_BLANK_LINES_RE.sub('\n\n', result)
     return result
 
 
@@ -631,11 +642,9 @@ def _fix_walrus_errors(go_output_path: str, test_output: str) -> int:
 
     Returns the number of lines fixed.
     """
-    # Pattern: file.go:line:col: no new variables on left side of :=
-    pattern = re.compile(r'(\S+\.go):(\d+):\d+:\s*no new variables on left side of :=')
     fixes_by_file: dict[str, list[int]] = {}
 
-    for match in pattern.finditer(test_output):
+    for match in _WALRUS_ERROR_RE.finditer(test_output):
         file_ref = match.group(1)
         line_num = int(match.group(2))
         # Resolve the file path
@@ -673,11 +682,9 @@ def _fix_unused_imports(go_output_path: str, test_output: str) -> int:
 
     Returns the number of imports removed.
     """
-    # Pattern: file.go:line:col: "pkg" imported and not used
-    pattern = re.compile(r'(\S+\.go):(\d+):\d+:\s*"([^"]+)"\s+imported and not used')
     removes_by_file: dict[str, set[int]] = {}
 
-    for match in pattern.finditer(test_output):
+    for match in _UNUSED_IMPORT_RE.finditer(test_output):
         file_ref = match.group(1)
         line_num = int(match.group(2))
         full_path = Path(go_output_path) / file_ref
@@ -704,8 +711,8 @@ def _fix_unused_imports(go_output_path: str, test_output: str) -> int:
         if total_removed:
             # Clean up empty import blocks
             code = "\n".join(new_lines)
-            code = re.sub(r'import\s*\(\s*\)', '', code)
-            code = re.sub(r'\n{3,}', '\n\n', code)
+            code = _EMPTY_IMPORT_BLOCK_RE.sub('', code)
+            code = _EXTRA_BLANK_LINES_RE.sub('\n\n', code)
             Path(file_path).write_text(code)
 
     return total_removed
@@ -728,11 +735,9 @@ def _fix_missing_imports(go_output_path: str, test_output: str) -> int:
         "encoding", "json", "xml", "http", "url", "sql",
     }
 
-    # Pattern: file.go:line:col: undefined: <name>
-    pattern = re.compile(r'(\S+\.go):\d+:\d+:\s*undefined:\s*(\w+)')
     adds_by_file: dict[str, set[str]] = {}
 
-    for match in pattern.finditer(test_output):
+    for match in _UNDEFINED_NAME_RE.finditer(test_output):
         file_ref = match.group(1)
         undefined_name = match.group(2)
         if undefined_name not in _STDLIB_PACKAGES:
@@ -773,12 +778,11 @@ def _fix_missing_imports(go_output_path: str, test_output: str) -> int:
                 continue
 
             # Add to existing import block or create one
-            if re.search(r'import\s*\(', code):
-                code = re.sub(r'(import\s*\()', rf'\1\n\t{import_str}', code, count=1)
+            if _IMPORT_BLOCK_START_RE.search(code):
+                code = _IMPORT_BLOCK_START_RE.sub(rf'\1\n\t{import_str}', code, count=1)
             else:
                 # Add after package line
-                code = re.sub(
-                    r'(package\s+\w+\s*\n)',
+                code = _PACKAGE_LINE_RE.sub(
                     rf'\1\nimport {import_str}\n',
                     code,
                     count=1,
@@ -0,0 +1,66 @@
+"""
+JSON helpers for Kaizen.
+
+Session persistence and the planner parse a lot of JSON. This module uses
+orjson for parsing when it is installed (pip install kaizen[fast]) and
+falls back to the standard library otherwise, so orjson stays an optional
+dependency.
+
+Encoding always uses the standard library. orjson silently writes NaN and
+Infinity as null and rejects integers wider than 64 bits, both of which
+json.dumps accepts, and that would break the save/load roundtrip guarantee
+for values Session.set() has already accepted.
+"""
+
+import json
+from typing import Any
+
+try:
+    import orjson
+except ImportError:  # pragma: no cover - depends on the environment
+    orjson = None  # type: ignore[assignment]
+
+
+# Separators for compact output (no padding after "," and ":")
+_COMPACT_SEPARATORS = (",", ":")
+
+
+def dumps(obj: Any) -> str:
+    """
+    Encode obj as compact JSON text.
+
+    Args:
+        obj: A JSON-serializable value.
+
+    Returns:
+        str: The JSON text.
+
+    Raises:
+        TypeError: If obj is not JSON-serializable.
+    """
+    return json.dumps(obj, separators=_COMPACT_SEPARATORS)
+
+
+def loads(data: str | bytes) -> Any:
+    """
+    Decode JSON text.
+
+    Uses orjson when available. Text that orjson rejects but the standard
+    library accepts (such as NaN or Infinity literals written by
+    json.dumps) is decoded by the standard library.
+
+    Args:
+        data: JSON text as str or UTF-8 bytes.
+
+    Returns:
+        Any: The decoded value.
+
+    Raises:
+        json.JSONDecodeError: If data is not valid JSON.
+    """
+    if orjson is not None:
+        try:
+            return orjson.loads(data)
+        except orjson.JSONDecodeError:
+            pass
+    return json.loads(data)
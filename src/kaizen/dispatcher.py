@@ -478,11 +478,10 @@ class Dispatcher:
 
         # Scan trajectory for successful PLAN_STEP_COMPLETED entries
         completed: set[tuple[int, str]] = set()
-        for entry in session.get_trajectory():
-            if entry.entry_type == EntryType.PLAN_STEP_COMPLETED:
-                content = entry.content
-                if content.get("success"):
-                    completed.add((content["step_index"], content["capability"]))
+        for entry in session.get_trajectory(entry_type=EntryType.PLAN_STEP_COMPLETED):
+            content = entry.content
+            if content.get("success"):
+                completed.add((content["step_index"], content["capability"]))
 
         # Execute steps, skipping already-completed ones
         results: list[InvokeResult] = []
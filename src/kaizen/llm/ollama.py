@@ -14,6 +14,7 @@ Configuration:
 - base_url: Ollama server URL (default: http://localhost:11434)
 - model: Model name (default: llama3.1:8b)
 - timeout: Request timeout in seconds (default: 120)
+- client: Optional shared httpx.Client for connection reuse
 
 Example usage:
     provider = OllamaProvider()  # Uses defaults
@@ -89,6 +90,7 @@ class OllamaProvider(LLMProvider):
         model: str = DEFAULT_MODEL,
         base_url: str = DEFAULT_BASE_URL,
         timeout: float = DEFAULT_TIMEOUT,
+        client: httpx.Client | None = None,
     ) -> None:
         """
         Initialize the Ollama provider.
@@ -97,14 +99,19 @@ class OllamaProvider(LLMProvider):
             model: Name of the Ollama model to use.
             base_url: URL of the Ollama server.
             timeout: Request timeout in seconds.
+            client: Optional httpx.Client to send requests through. The
+                    caller owns it (the provider never closes it), and its
+                    connection pool is reused across requests.
         """
         self._model = model
         self._base_url = base_url.rstrip("/")  # Remove trailing slash
         self._timeout = timeout
+        self._client = client
 
-        # Create HTTP client
-        # We create a new client for each request to avoid connection issues
-        # (Ollama can have long-running requests that might timeout keepalive)
+        # HTTP client configuration
+        # Without a shared client we create a new one for each request to
+        # avoid connection issues (Ollama can have long-running requests
+        # that might timeout keepalive)
         self._client_timeout = httpx.Timeout(timeout, connect=10.0)
 
     @property
@@ -165,13 +172,14 @@ class OllamaProvider(LLMProvider):
 
         # Make the request
         try:
-            with httpx.Client(timeout=self._client_timeout) as client:
-                response = client.post(
-                    f"{self._base_url}/api/generate",
-                    json=payload,
-                )
-                response.raise_for_status()
-                data = response.json()
+            response = self._request(
+                "post",
+                f"{self._base_url}/api/generate",
+                self._client_timeout,
+                json=payload,
+            )
+            response.raise_for_status()
+            data = response.json()
 
         except httpx.ConnectError as e:
             raise LLMError(
@@ -237,9 +245,10 @@ class OllamaProvider(LLMProvider):
             bool: True if server responds, False otherwise.
         """
         try:
-            with httpx.Client(timeout=httpx.Timeout(5.0)) as client:
-                response = client.get(f"{self._base_url}/api/tags")
-                return response.status_code == 200
+            response = self._request(
+                "get", f"{self._base_url}/api/tags", httpx.Timeout(5.0)
+            )
+            return response.status_code == 200
         except Exception:
             return False
 
@@ -254,11 +263,12 @@ class OllamaProvider(LLMProvider):
             LLMError: If the request fails.
         """
         try:
-            with httpx.Client(timeout=httpx.Timeout(10.0)) as client:
-                response = client.get(f"{self._base_url}/api/tags")
-                response.raise_for_status()
-                data = response.json()
-                return [m["name"] for m in data.get("models", [])]
+            response = self._request(
+                "get", f"{self._base_url}/api/tags", httpx.Timeout(10.0)
+            )
+            response.raise_for_status()
+            data = response.json()
+            return [m["name"] for m in data.get("models", [])]
 
         except Exception as e:
             raise LLMError(
@@ -267,6 +277,31 @@ class OllamaProvider(LLMProvider):
                 details={"error": str(e)},
             ) from e
 
+    def _request(
+        self,
+        method: str,
+        url: str,
+        timeout: httpx.Timeout,
+        **kwargs: Any,
+    ) -> httpx.Response:
+        """
+        Send a request via the shared client, or a one-off client if none.
+
+        Args:
+            method: Client method name ("get" or "post").
+            url: Full request URL.
+            timeout: Timeout for this request.
+            **kwargs: Passed through to the client method (e.g. json=).
+
+        Returns:
+            httpx.Response: The fully-read response.
+        """
+        if self._client is not None:
+            return getattr(self._client, method)(url, timeout=timeout, **kwargs)
+
+        with httpx.Client(timeout=timeout) as client:
+            return getattr(client, method)(url, **kwargs)
+
     def __repr__(self) -> str:
         """String representation for debugging."""
         return f"OllamaProvider(model={self._model!r}, base_url={self._base_url!r})"
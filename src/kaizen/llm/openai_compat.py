@@ -9,6 +9,7 @@ Configuration:
 - model: Model name/identifier
 - api_key: Optional API key for authenticated endpoints
 - timeout: Request timeout in seconds (default: 120)
+- client: Optional shared httpx.Client for connection reuse
 
 Example usage:
     provider = OpenAICompatProvider(
@@ -61,6 +62,7 @@ class OpenAICompatProvider(LLMProvider):
         timeout: float = DEFAULT_TIMEOUT,
         endpoint: str = DEFAULT_ENDPOINT,
         max_tokens: int | None = None,
+        client: httpx.Client | None = None,
     ) -> None:
         """
         Initialize the OpenAI-compatible provider.
@@ -72,6 +74,9 @@ class OpenAICompatProvider(LLMProvider):
             timeout: Request timeout in seconds.
             endpoint: API endpoint path (default: /v1/chat/completions).
             max_tokens: Max tokens for completion (None = server default).
+            client: Optional httpx.Client to send requests through. The
+                    caller owns it (the provider never closes it), and its
+                    connection pool is reused across requests.
         """
         self._model = model
         self._base_url = base_url.rstrip("/")
@@ -79,6 +84,7 @@ class OpenAICompatProvider(LLMProvider):
         self._timeout = timeout
         self._endpoint = endpoint
         self._max_tokens = max_tokens
+        self._client = client
 
         self._client_timeout = httpx.Timeout(timeout, connect=10.0)
 
@@ -146,10 +152,21 @@ class OpenAICompatProvider(LLMProvider):
         url = f"{self._base_url}{self._endpoint}"
 
         try:
-            with httpx.Client(timeout=self._client_timeout, follow_redirects=True) as client:
-                response = client.post(url, json=payload, headers=headers)
-                response.raise_for_status()
-                data = response.json()
+            if self._client is not None:
+                response = self._client.post(
+                    url,
+                    json=payload,
+                    headers=headers,
+                    timeout=self._client_timeout,
+                    follow_redirects=True,
+                )
+            else:
+                with httpx.Client(
+                    timeout=self._client_timeout, follow_redirects=True
+                ) as client:
+                    response = client.post(url, json=payload, headers=headers)
+            response.raise_for_status()
+            data = response.json()
 
         except httpx.ConnectError as e:
             raise LLMError(
@@ -33,8 +33,10 @@ Example usage:
 
 import json
 import re
+import sys
 from typing import Any
 
+from kaizen import _json
 from kaizen.llm.base import LLMProvider, LLMError
 from kaizen.types import CapabilityCall, ErrorCode, EntryType
 
@@ -147,6 +149,59 @@ Example output: [{{"capability": "reverse", "params": {{"key": "text"}}}}, {{"ca
 
 Remember: Return ONLY the JSON array, nothing else."""
 
+# Characters that matter when scanning for the end of a JSON array: brackets
+# change the nesting depth, and quotes/backslashes delimit string literals
+# (brackets inside strings don't count).
+_JSON_ARRAY_TOKEN_RE = re.compile(r'[\[\]"\\]')
+
+
+def _extract_json_array(text: str) -> str | None:
+    """
+    Find the first complete JSON array in text.
+
+    Scans forward from the first "[" and tracks bracket depth, ignoring
+    brackets inside string literals. Only the structural characters are
+    visited (located by a precompiled pattern), so the scan is a single
+    linear pass with no backtracking.
+
+    Args:
+        text: Text that may contain a JSON array among other content.
+
+    Returns:
+        str | None: The array text, or None if text contains no "[".
+            If the array is never closed, everything from the "[" on is
+            returned so that the JSON parser reports the error.
+    """
+    start = text.find("[")
+    if start == -1:
+        return None
+
+    depth = 0
+    in_string = False
+    skip_to = start  # Position after an escaped character inside a string
+
+    for match in _JSON_ARRAY_TOKEN_RE.finditer(text, start):
+        pos = match.start()
+        if pos < skip_to:
+            continue
+        char = match.group()
+
+        if in_string:
+            if char == "\\":
+                skip_to = pos + 2  # Skip the escaped character
+            elif char == '"':
+                in_string = False
+        elif char == '"':
+            in_string = True
+        elif char == "[":
+            depth += 1
+        elif char == "]":
+            depth -= 1
+            if depth == 0:
+                return text[start:pos + 1]
+
+    return text[start:]
+
 
 class Planner:
     """
@@ -184,21 +239,33 @@ class Planner:
             capabilities: Optional initial list of capabilities.
         """
         self._provider = provider
-        self._capabilities: list[str] = capabilities or []
+        # Insertion-ordered dict used as an ordered set: O(1) membership
+        # checks in add_capability() and _validate_calls(). Names are
+        # interned so those lookups usually match on identity.
+        self._capabilities: dict[str, None] = dict.fromkeys(
+            map(sys.intern, capabilities or [])
+        )
+
+        # System prompt built from _capabilities, rebuilt lazily after the
+        # capabilities change
+        self._system_prompt: str | None = None
 
     @property
     def capabilities(self) -> list[str]:
         """Get the list of available capabilities."""
-        return self._capabilities.copy()
+        return list(self._capabilities)
 
     def set_capabilities(self, capabilities: list[str]) -> None:
         """
         Set the available capabilities.
 
+        Duplicate names are dropped, keeping the first occurrence.
+
         Args:
             capabilities: List of capability names.
         """
-        self._capabilities = list(capabilities)
+        self._capabilities = dict.fromkeys(map(sys.intern, capabilities))
+        self._system_prompt = None
 
     def add_capability(self, capability: str) -> None:
         """
@@ -208,7 +275,8 @@ class Planner:
             capability: Capability name to add.
         """
         if capability not in self._capabilities:
-            self._capabilities.append(capability)
+            self._capabilities[sys.intern(capability)] = None
+            self._system_prompt = None
 
     def plan(
         self,
@@ -235,9 +303,13 @@ class Planner:
                 message="No capabilities available. Register agents with the dispatcher first.",
             )
 
-        # Build the system prompt with available capabilities
-        capabilities_text = "\n".join(f"- {cap}" for cap in self._capabilities)
-        system_prompt = SYSTEM_PROMPT.format(capabilities=capabilities_text)
+        # Build the system prompt with available capabilities (once per
+        # change to the capabilities, not once per plan)
+        system_prompt = self._system_prompt
+        if system_prompt is None:
+            capabilities_text = "\n".join(f"- {cap}" for cap in self._capabilities)
+            system_prompt = SYSTEM_PROMPT.format(capabilities=capabilities_text)
+            self._system_prompt = system_prompt
 
         # Call the LLM
         try:
@@ -307,18 +379,16 @@ class Planner:
         """
         # Try to find JSON array in the response
         # The LLM might include extra text before/after
-        json_match = re.search(r'\[.*\]', text, re.DOTALL)
+        json_text = _extract_json_array(text)
 
-        if not json_match:
+        if json_text is None:
             # Maybe it's empty or just says something like "no capabilities needed"
             if any(word in text.lower() for word in ["empty", "none", "no ", "[]"]):
                 return []
             raise ValueError(f"No JSON array found in response: {text[:200]}")
 
-        json_text = json_match.group(0)
-
         try:
-            data = json.loads(json_text)
+            data = _json.loads(json_text)  # orjson when installed
         except json.JSONDecodeError as e:
             raise ValueError(f"Invalid JSON: {e}") from e
 
@@ -331,13 +401,20 @@ class Planner:
             if not isinstance(item, dict):
                 raise ValueError(f"Item {i} is not an object: {item}")
 
-            if "capability" not in item:
+            capability = item.get("capability")
+            if capability is None:
                 raise ValueError(f"Item {i} missing 'capability' field")
 
-            calls.append(CapabilityCall(
-                capability=item["capability"],
-                params=item.get("params", {}),
-            ))
+            # A missing or null "params" means no parameters. The empty dict
+            # is only built in that case, and each call gets its own since
+            # CapabilityCall.params is mutable.
+            params = item.get("params")
+            if params is None:
+                params = {}
+            elif not isinstance(params, dict):
+                raise ValueError(f"Item {i} 'params' is not an object: {params}")
+
+            calls.append(CapabilityCall(capability=capability, params=params))
 
         return calls
 
@@ -355,7 +432,7 @@ class Planner:
             if call.capability not in self._capabilities:
                 return (
                     f"Unknown capability '{call.capability}'. "
-                    f"Available: {self._capabilities}"
+                    f"Available: {list(self._capabilities)}"
                 )
         return None
 
@@ -363,5 +440,5 @@ class Planner:
         """String representation for debugging."""
         return (
             f"Planner(provider={self._provider.model_name}, "
-            f"capabilities={self._capabilities})"
+            f"capabilities={list(self._capabilities)})"
         )
@@ -23,15 +23,24 @@ Key Invariants:
 - Save/load roundtrip preserves all data
 """
 
+import bisect
 import copy
 import json
+import os
+import pickle
 import sqlite3
-import uuid
-from datetime import datetime, timezone
+import stat
+import tempfile
+from datetime import datetime, timedelta, timezone
 from pathlib import Path
-from typing import Any
+from typing import Any, Iterable
 
-from kaizen.types import TrajectoryEntry, EntryType, ErrorCode
+from kaizen import _json
+from kaizen.types import (
+    TrajectoryEntry,
+    EntryType,
+    ErrorCode,
+)
 
 
 # =============================================================================
@@ -43,7 +52,297 @@ from kaizen.types import TrajectoryEntry, EntryType, ErrorCode
 DEFAULT_MAX_ARTIFACT_SIZE = 100 * 1024 * 1024
 
 # Current schema version for persistence format
-SCHEMA_VERSION = 1
+SCHEMA_VERSION = 2
+
+# Schema versions load() can read. Version 1 stored trajectory timestamps
+# as ISO-8601 text; version 2 stores integer microseconds since the epoch.
+_READABLE_SCHEMA_VERSIONS = (1, 2)
+
+# The UTC tzinfo, bound once at module level: timestamps are taken on
+# every append, and this skips an attribute lookup on each one
+_UTC = timezone.utc
+
+# Reference points for the integer timestamp encoding
+_EPOCH = datetime(1970, 1, 1, tzinfo=_UTC)
+_ONE_MICROSECOND = timedelta(microseconds=1)
+
+# Exact types of atomic JSON values. They are immutable and always
+# serializable, so state operations skip validation and copying for them.
+# (Checked with type(), not isinstance(): subclasses take the normal path.)
+_ATOMIC_TYPES = frozenset({str, int, float, bool, type(None)})
+
+# Connection tuning applied when saving or loading a session file. Both are
+# one-shot bulk operations: keep temporary structures in memory, read through
+# a memory map (256MB) and allow a larger page cache (20MB).
+_CONNECTION_PRAGMAS = (
+    "PRAGMA temp_store = MEMORY",
+    "PRAGMA mmap_size = 268435456",
+    "PRAGMA cache_size = -20000",
+)
+
+
+# =============================================================================
+# SQL STATEMENTS
+# =============================================================================
+
+
+# Database schema for session persistence, created in one executescript()
+# call. save() always writes a fresh file, so no IF NOT EXISTS or DELETE
+# handling is needed.
+_SCHEMA_SQL = """
+-- Metadata table (single row)
+-- Small text-keyed tables are stored WITHOUT ROWID so the
+-- primary key is the b-tree key and no separate rowid index
+-- is kept.
+CREATE TABLE metadata (
+    key TEXT PRIMARY KEY,
+    value TEXT NOT NULL
+) WITHOUT ROWID;
+
+-- State table (key-value pairs)
+CREATE TABLE state (
+    key TEXT PRIMARY KEY,
+    value_json TEXT NOT NULL
+) WITHOUT ROWID;
+
+-- Trajectory table (append-only log)
+-- seq_num is an INTEGER PRIMARY KEY, i.e. already the rowid
+-- timestamp is microseconds since the Unix epoch (UTC)
+CREATE TABLE trajectory (
+    seq_num INTEGER PRIMARY KEY,
+    timestamp INTEGER NOT NULL,
+    agent_id TEXT NOT NULL,
+    entry_type TEXT NOT NULL,
+    content_json TEXT NOT NULL
+);
+
+-- Artifacts table (binary blobs)
+-- Keeps its rowid: incremental blob I/O addresses rows by rowid
+CREATE TABLE artifacts (
+    name TEXT PRIMARY KEY,
+    data BLOB NOT NULL
+);
+"""
+
+# Statement text is defined once so every save/load passes the identical
+# string and hits the connection's prepared-statement cache.
+_INSERT_METADATA_SQL = "INSERT INTO metadata (key, value) VALUES (?, ?)"
+_INSERT_STATE_SQL = "INSERT INTO state (key, value_json) VALUES (?, ?)"
+_INSERT_TRAJECTORY_SQL = (
+    "INSERT INTO trajectory (seq_num, timestamp, agent_id, entry_type, content_json) "
+    "VALUES (?, ?, ?, ?, ?)"
+)
+_INSERT_ARTIFACT_SQL = "INSERT INTO artifacts (name, data) VALUES (?, zeroblob(?))"
+
+_SELECT_METADATA_SQL = "SELECT key, value FROM metadata"
+_SELECT_STATE_SQL = "SELECT key, value_json FROM state"
+_SELECT_TRAJECTORY_SQL = (
+    "SELECT seq_num, timestamp, agent_id, entry_type, content_json "
+    "FROM trajectory ORDER BY seq_num"
+)
+# ORDER BY name walks the primary key index, so no sort step is needed
+_SELECT_ARTIFACTS_SQL = "SELECT rowid, name FROM artifacts ORDER BY name"
+
+
+# =============================================================================
+# FILE HELPERS
+# =============================================================================
+
+
+def _file_mode(path: Path) -> int:
+    """
+    Return the permission bits for a session file written to path.
+
+    An existing file keeps its mode. A new file gets the mode an ordinary
+    open() would give it, 0o666 minus the process umask, rather than the
+    0o600 that mkstemp() uses.
+    """
+    try:
+        return stat.S_IMODE(path.stat().st_mode)
+    except FileNotFoundError:
+        # The umask can only be read by setting it
+        umask = os.umask(0)
+        os.umask(umask)
+        return 0o666 & ~umask
+
+
+def _fsync_path(path: Path) -> None:
+    """Flush a file or directory to disk."""
+    fd = os.open(path, os.O_RDONLY)
+    try:
+        os.fsync(fd)
+    finally:
+        os.close(fd)
+
+
+# =============================================================================
+# SESSION IDS
+# =============================================================================
+
+
+def _new_session_id() -> str:
+    """
+    Generate a random session ID in the canonical UUID4 text form.
+
+    Equivalent to str(uuid.uuid4()), but formats the random bytes directly
+    instead of building a UUID object, which is about twice as fast.
+
+    Returns:
+        str: A 36-character hyphenated UUID4 string.
+    """
+    raw = bytearray(os.urandom(16))
+    raw[6] = (raw[6] & 0x0F) | 0x40  # version 4
+    raw[8] = (raw[8] & 0x3F) | 0x80  # RFC 4122 variant
+    h = raw.hex()
+    return f"{h[:8]}-{h[8:12]}-{h[12:16]}-{h[16:20]}-{h[20:]}"
+
+
+# =============================================================================
+# VALUE COPYING
+# =============================================================================
+
+
+# Container types whose empty instances can be copied by constructing a new
+# empty instance (tuple() returns the shared empty tuple, which is immutable)
+_EMPTY_COPY_TYPES = frozenset({dict, list, tuple})
+
+
+def _is_flat_container(value_type: type, value: Any) -> bool:
+    """Return True if value is a plain dict or list holding only atomic values."""
+    if value_type is dict:
+        return all(map(_ATOMIC_TYPES.__contains__, map(type, value.values())))
+    if value_type is list:
+        return all(map(_ATOMIC_TYPES.__contains__, map(type, value)))
+    return False
+
+
+def _fast_deepcopy(value: Any) -> Any:
+    """
+    Deep-copy a JSON-style value, skipping copy.deepcopy where possible.
+
+    Atomic values are immutable and returned as-is, and empty containers
+    are replaced by new empty ones. Small, shallow values - the common
+    shape of state values and trajectory content - are cloned by hand: a
+    dict or list of atomic values only needs a shallow copy, and a dict
+    whose values are atomic or such flat containers copies each of them in
+    turn. Other values are cloned with a pickle roundtrip: for the
+    JSON-style data stored in a session this runs in C and is several
+    times faster than copy.deepcopy, and like deepcopy it preserves types
+    and shared references. Values pickle cannot handle (e.g. instances of
+    locally defined classes) fall back to copy.deepcopy.
+
+    The hand-rolled path does not preserve references shared between the
+    values of one dict. Values stored in a session are validated as JSON,
+    which has no shared references, and a save/load roundtrip loses them
+    anyway.
+
+    Args:
+        value: The value to copy.
+
+    Returns:
+        Any: A copy of value that shares no mutable objects with it.
+    """
+    value_type = type(value)
+    if value_type in _ATOMIC_TYPES:
+        return value
+    if value_type in _EMPTY_COPY_TYPES and not value:
+        return value_type()
+    if _is_flat_container(value_type, value):
+        return value.copy()
+    if value_type is dict:
+        clone = {}
+        for key, item in value.items():
+            item_type = type(item)
+            if item_type in _ATOMIC_TYPES:
+                clone[key] = item
+            elif _is_flat_container(item_type, item):
+                clone[key] = item.copy()
+            else:
+                break
+        else:
+            return clone
+    try:
+        return pickle.loads(pickle.dumps(value, pickle.HIGHEST_PROTOCOL))
+    except Exception:
+        return copy.deepcopy(value)
+
+
+# Nesting depth beyond which _copy_plain_json() gives up and defers to
+# json.dumps, which also detects cyclic values
+_PLAIN_JSON_MAX_DEPTH = 32
+
+
+class _NotPlainJson(Exception):
+    """Raised by _copy_plain_json() for values it cannot handle itself."""
+
+
+def _copy_plain_json(value: Any, depth: int = 0) -> Any:
+    """
+    Copy a value made only of plain dicts, lists and atomic values.
+
+    The walk both proves the value JSON-serializable and builds its deep
+    copy, so it visits the value once instead of encoding it with
+    json.dumps and then copying it.
+
+    Args:
+        value: The value to copy.
+        depth: Current nesting depth (used by the recursion).
+
+    Returns:
+        Any: A deep copy of value.
+
+    Raises:
+        _NotPlainJson: If value holds anything else (tuples, non-string
+                       keys, subclasses, other types) or is nested too
+                       deeply. This does not mean the value is invalid.
+    """
+    value_type = type(value)
+    if value_type in _ATOMIC_TYPES:
+        return value
+    if depth >= _PLAIN_JSON_MAX_DEPTH:
+        raise _NotPlainJson
+    if value_type is dict:
+        clone = {}
+        for key, item in value.items():
+            if type(key) is not str:
+                raise _NotPlainJson
+            clone[key] = item if type(item) in _ATOMIC_TYPES else _copy_plain_json(item, depth + 1)
+        return clone
+    if value_type is list:
+        return [
+            item if type(item) in _ATOMIC_TYPES else _copy_plain_json(item, depth + 1)
+            for item in value
+        ]
+    raise _NotPlainJson
+
+
+def _validated_copy(value: Any, label: str) -> Any:
+    """
+    Check that a value is JSON-serializable and return a deep copy of it.
+
+    Plain JSON values are validated and copied in one walk. Anything else
+    is validated by attempting serialization and copied with
+    _fast_deepcopy().
+
+    Args:
+        value: The value to check and copy.
+        label: What the value is, for the error message (e.g. "Value").
+
+    Returns:
+        Any: A deep copy of value.
+
+    Raises:
+        ValueError: If value cannot be serialized to JSON.
+    """
+    try:
+        return _copy_plain_json(value)
+    except _NotPlainJson:
+        pass
+    try:
+        json.dumps(value)
+    except (TypeError, ValueError) as e:
+        raise ValueError(f"{label} must be JSON-serializable: {e}") from e
+    return _fast_deepcopy(value)
 
 
 # =============================================================================
@@ -81,6 +380,21 @@ class Session:
         restored = Session.load("my_session.kaizen")
     """
 
+    # A fixed attribute layout: no per-instance __dict__, and a typo in an
+    # attribute name fails loudly instead of creating a new attribute.
+    __slots__ = (
+        "_session_id",
+        "_max_artifact_size",
+        "_workspace_path",
+        "_state",
+        "_state_version",
+        "_trajectory",
+        "_entries_by_type",
+        "_next_seq_num",
+        "_artifacts",
+        "_artifact_names",
+    )
+
     def __init__(
         self,
         session_id: str | None = None,
@@ -97,7 +411,7 @@ class Session:
         """
         # Generate a unique session ID if not provided
         # Using UUID4 for random unique identifiers
-        self._session_id = session_id or str(uuid.uuid4())
+        self._session_id = session_id or _new_session_id()
 
         # Configuration
         self._max_artifact_size = max_artifact_size
@@ -122,6 +436,10 @@ class Session:
         # Each entry has a sequence number starting at 1.
         self._trajectory: list[TrajectoryEntry] = []
 
+        # The same entries grouped by type (each list in trajectory order),
+        # so get_trajectory(entry_type=...) only visits matching entries.
+        self._entries_by_type: dict[EntryType, list[TrajectoryEntry]] = {}
+
         # Next sequence number for trajectory entries.
         # Starts at 1 (not 0) for human readability.
         self._next_seq_num: int = 1
@@ -133,6 +451,10 @@ class Session:
         # In-memory storage for now; persisted to SQLite on save().
         self._artifacts: dict[str, bytes] = {}
 
+        # Artifact names kept in sorted order as they are added, so
+        # list_artifacts() does not sort on every call.
+        self._artifact_names: list[str] = []
+
         # -----------------------------------------------------------------
         # Session Lifecycle
         # -----------------------------------------------------------------
@@ -148,6 +470,50 @@ class Session:
             },
         )
 
+    def __deepcopy__(self, memo: dict[int, Any]) -> "Session":
+        """
+        Deep-copy the session without the generic copy.deepcopy machinery.
+
+        State values are copied with _fast_deepcopy(), and the contents of
+        all trajectory entries in a single pass; the entries' other fields
+        and the artifact bytes are immutable and shared with the copy.
+
+        Subclass instances are copied generically instead, since a subclass
+        may add slots or attributes that this method does not know about.
+        """
+        if type(self) is not Session:
+            # Same steps as copy.deepcopy's default path: rebuild the
+            # instance from its pickle state, deep-copying that state
+            constructor, args, state = self.__reduce_ex__(4)[:3]
+            clone = constructor(*args)
+            memo[id(self)] = clone
+            dict_state, slot_state = copy.deepcopy(state, memo)
+            if dict_state:
+                clone.__dict__.update(dict_state)
+            for name, value in slot_state.items():
+                setattr(clone, name, value)
+            return clone
+
+        clone = object.__new__(Session)
+        memo[id(self)] = clone
+
+        clone._session_id = self._session_id
+        clone._max_artifact_size = self._max_artifact_size
+        clone._workspace_path = self._workspace_path
+
+        clone._state = {key: _fast_deepcopy(value) for key, value in self._state.items()}
+        clone._state_version = self._state_version
+
+        contents = _fast_deepcopy([entry.content for entry in self._trajectory])
+        clone._trajectory = list(map(TrajectoryEntry._with_content, self._trajectory, contents))
+        clone._entries_by_type = {}
+        clone._index_entries(clone._trajectory)
+        clone._next_seq_num = self._next_seq_num
+
+        clone._artifacts = self._artifacts.copy()
+        clone._artifact_names = self._artifact_names.copy()
+        return clone
+
     # =========================================================================
     # PROPERTIES
     # =========================================================================
@@ -207,8 +573,8 @@ class Session:
 
         # Return a deep copy to maintain isolation invariant.
         # External code cannot modify internal state by mutating
-        # the returned value.
-        return copy.deepcopy(self._state[key])
+        # the returned value. Atomic values are immutable and need no copy.
+        return _fast_deepcopy(self._state[key])
 
     def set(self, key: str, value: Any) -> int:
         """
@@ -237,34 +603,40 @@ class Session:
         if not key or not isinstance(key, str):
             raise ValueError("Key must be a non-empty string")
 
-        # Validate that value is JSON-serializable by attempting serialization.
-        # This catches non-serializable types early with a clear error.
-        try:
-            json.dumps(value)
-        except (TypeError, ValueError) as e:
-            raise ValueError(f"Value must be JSON-serializable: {e}") from e
+        if type(value) in _ATOMIC_TYPES:
+            # Fast path: immutable and always serializable, so the value
+            # can be stored and logged as-is
+            stored = logged = value
+        else:
+            # Validate that value is JSON-serializable (catching
+            # non-serializable types early with a clear error) and store a
+            # deep copy to maintain isolation. External code cannot modify
+            # internal state by mutating the original value after set().
+            # The trajectory entry gets its own copy for the same reason.
+            stored = _validated_copy(value, "Value")
+            logged = _fast_deepcopy(stored)
 
         # Store old value for trajectory (None if key didn't exist)
         old_value = self._state.get(key)
 
-        # Store a deep copy to maintain isolation.
-        # External code cannot modify internal state by mutating
-        # the original value after set().
-        self._state[key] = copy.deepcopy(value)
+        self._state[key] = stored
 
         # Increment version number (monotonic)
         self._state_version += 1
 
-        # Record the state change in trajectory
+        # Record the state change in trajectory. The value was validated
+        # and copied above, and old_value was only referenced by _state
+        # (get() hands out copies), so the content needs no further copy.
         self._append_internal(
             agent_id="system",
             entry_type=EntryType.STATE_SET,
             content={
                 "key": key,
                 "old_value": old_value,
-                "new_value": value,
+                "new_value": logged,
                 "state_version": self._state_version,
             },
+            trusted=True,
         )
 
         return self._state_version
@@ -294,7 +666,7 @@ class Session:
         Returns:
             dict: Deep copy of all state data.
         """
-        return copy.deepcopy(self._state)
+        return {key: _fast_deepcopy(value) for key, value in self._state.items()}
 
     # =========================================================================
     # TRAJECTORY MANAGEMENT
@@ -333,6 +705,8 @@ class Session:
         agent_id: str,
         entry_type: EntryType,
         content: dict[str, Any],
+        *,
+        trusted: bool = False,
     ) -> int:
         """
         Internal append method (shared by public append and internal operations).
@@ -344,27 +718,31 @@ class Session:
             agent_id: ID of the agent creating this entry.
             entry_type: Classification of the entry.
             content: Structured content.
+            trusted: True when the caller built content itself from values
+                     that are already known to be JSON-serializable and that
+                     nothing else references. The serializability check and
+                     the defensive copy are then skipped.
 
         Returns:
             int: The sequence number assigned to this entry.
         """
-        # Validate content is JSON-serializable
-        try:
-            json.dumps(content)
-        except (TypeError, ValueError) as e:
-            raise ValueError(f"Content must be JSON-serializable: {e}") from e
+        if not trusted:
+            # Validate content is JSON-serializable and store a copy for
+            # isolation
+            content = _validated_copy(content, "Content")
 
         # Create the entry with current timestamp and next sequence number
         entry = TrajectoryEntry(
             seq_num=self._next_seq_num,
-            timestamp=datetime.now(timezone.utc),
+            timestamp=datetime.now(_UTC),
             agent_id=agent_id,
             entry_type=entry_type,
-            content=copy.deepcopy(content),  # Store a copy for isolation
+            content=content,
         )
 
         # Append to trajectory (the only mutation allowed)
         self._trajectory.append(entry)
+        self._entries_by_type.setdefault(entry.entry_type, []).append(entry)
 
         # Increment sequence number for next entry
         seq_num = self._next_seq_num
@@ -372,31 +750,111 @@ class Session:
 
         return seq_num
 
-    def get_trajectory(self, limit: int | None = None) -> list[TrajectoryEntry]:
+    def append_many(
+        self,
+        entries: Iterable[tuple[str, EntryType, dict[str, Any]]],
+    ) -> list[int]:
+        """
+        Append several entries to the trajectory in one call.
+
+        Equivalent to calling append() for each (agent_id, entry_type,
+        content) tuple in order, except that all entries share one
+        timestamp and the batch is all-or-nothing: if any entry is
+        invalid, none are appended.
+
+        Args:
+            entries: Iterable of (agent_id, entry_type, content) tuples.
+
+        Returns:
+            list[int]: The sequence numbers assigned, in order.
+
+        Raises:
+            ValueError: If any agent_id is empty or any content is not
+                        serializable.
+        """
+        timestamp = datetime.now(_UTC)
+        seq_num = self._next_seq_num
+        new_entries = []
+
+        for agent_id, entry_type, content in entries:
+            new_entries.append(
+                TrajectoryEntry(
+                    seq_num=seq_num,
+                    timestamp=timestamp,
+                    agent_id=agent_id,
+                    entry_type=entry_type,
+                    # Validated, and copied for isolation
+                    content=_validated_copy(content, "Content"),
+                )
+            )
+            seq_num += 1
+
+        # Only touch the trajectory once every entry has been built
+        self._trajectory.extend(new_entries)
+        self._index_entries(new_entries)
+        first = self._next_seq_num
+        self._next_seq_num = seq_num
+
+        return list(range(first, seq_num))
+
+    def get_trajectory(
+        self,
+        limit: int | None = None,
+        agent_id: str | None = None,
+        entry_type: EntryType | None = None,
+    ) -> list[TrajectoryEntry]:
         """
         Get trajectory entries.
 
         Returns entries in chronological order (oldest first).
         If limit is specified, returns only the most recent N entries.
+        Filters are applied before the limit, so limit=1 with a filter
+        returns the most recent matching entry.
 
         Args:
             limit: Maximum number of entries to return. If None, returns all.
                    If specified, returns the N most recent entries.
+            agent_id: If given, only return entries created by this agent.
+            entry_type: If given, only return entries of this type.
 
         Returns:
             list[TrajectoryEntry]: List of trajectory entries.
             Note: Returns copies of entries to maintain isolation.
         """
-        if limit is None:
-            # Return all entries (as copies)
-            return list(self._trajectory)
-
-        if limit <= 0:
+        if limit is not None and limit <= 0:
             return []
 
+        # A type filter starts from the per-type index, so only entries of
+        # that type are visited rather than the whole trajectory
+        if entry_type is not None:
+            entries = self._entries_by_type.get(entry_type, [])
+        else:
+            entries = self._trajectory
+
+        # Filter in a single pass (callers no longer need to fetch the
+        # whole trajectory and filter it themselves). The comprehension
+        # already builds a new list, so it is only sliced if the limit
+        # actually drops entries.
+        if agent_id is not None:
+            entries = [e for e in entries if e.agent_id == agent_id]
+            if limit is None or limit >= len(entries):
+                return entries
+            return entries[-limit:]
+
+        if limit is None:
+            # Return all entries (as a new list)
+            return entries.copy()
+
         # Return most recent N entries
-        # Slice from the end to get most recent, preserving chronological order
-        return list(self._trajectory[-limit:])
+        # Slice from the end to get most recent, preserving chronological order.
+        # Slicing builds a new list, so no further copy is needed.
+        return entries[-limit:]
+
+    def _index_entries(self, entries: list[TrajectoryEntry]) -> None:
+        """Add entries (already appended to the trajectory) to the by-type index."""
+        by_type = self._entries_by_type
+        for entry in entries:
+            by_type.setdefault(entry.entry_type, []).append(entry)
 
     def get_trajectory_length(self) -> int:
         """
@@ -407,11 +865,30 @@ class Session:
         """
         return len(self._trajectory)
 
+    def is_trajectory_contiguous(self) -> bool:
+        """
+        Check that trajectory sequence numbers have no gaps or repeats.
+
+        Each entry's seq_num must be exactly one more than the previous
+        entry's. Empty and single-entry trajectories are contiguous.
+
+        Returns:
+            bool: True if sequence numbers are consecutive.
+        """
+        if len(self._trajectory) < 2:
+            return True
+
+        # Compare against the expected range in one list comparison
+        # rather than checking neighbouring pairs in a Python loop.
+        first = self._trajectory[0].seq_num
+        expected = range(first, first + len(self._trajectory))
+        return [entry.seq_num for entry in self._trajectory] == list(expected)
+
     # =========================================================================
     # ARTIFACT MANAGEMENT
     # =========================================================================
 
-    def write_artifact(self, name: str, data: bytes) -> None:
+    def write_artifact(self, name: str, data: bytes | bytearray | memoryview) -> None:
         """
         Store a binary artifact in the session.
 
@@ -420,33 +897,47 @@ class Session:
 
         Args:
             name: Name/identifier for the artifact. Must be non-empty.
-            data: Binary data to store.
+            data: Binary data to store. bytes are stored as-is; bytearray
+                  and memoryview data is copied into an immutable bytes
+                  object, so later changes to the buffer don't leak in.
 
         Raises:
             ValueError: If name is empty or data exceeds max_artifact_size.
-            TypeError: If data is not bytes.
+            TypeError: If data is not bytes, bytearray or memoryview.
         """
         # Validate name
         if not name or not isinstance(name, str):
             raise ValueError("Artifact name must be a non-empty string")
 
-        # Validate data type
-        if not isinstance(data, bytes):
-            raise TypeError(f"Artifact data must be bytes, got {type(data).__name__}")
+        # Validate data type and size. The size is checked before any copy,
+        # so an oversized buffer is rejected without being duplicated.
+        if isinstance(data, bytes):
+            size = len(data)
+        elif isinstance(data, (bytearray, memoryview)):
+            size = data.nbytes if isinstance(data, memoryview) else len(data)
+        else:
+            raise TypeError(
+                f"Artifact data must be bytes, bytearray or memoryview, "
+                f"got {type(data).__name__}"
+            )
 
-        # Validate size
-        if len(data) > self._max_artifact_size:
+        if size > self._max_artifact_size:
             raise ValueError(
-                f"Artifact size ({len(data)} bytes) exceeds maximum "
+                f"Artifact size ({size} bytes) exceeds maximum "
                 f"({self._max_artifact_size} bytes)"
             )
 
+        if not isinstance(data, bytes):
+            data = bytes(data)
+
         # Check if this is a new artifact or an update
         is_update = name in self._artifacts
         old_size = len(self._artifacts[name]) if is_update else None
 
         # Store the artifact
         self._artifacts[name] = data
+        if not is_update:
+            bisect.insort(self._artifact_names, name)
 
         # Record in trajectory
         self._append_internal(
@@ -454,10 +945,11 @@ class Session:
             entry_type=EntryType.ARTIFACT_WRITTEN,
             content={
                 "name": name,
-                "size": len(data),
+                "size": size,
                 "is_update": is_update,
                 "old_size": old_size,
             },
+            trusted=True,
         )
 
     def read_artifact(self, name: str) -> bytes:
@@ -486,7 +978,7 @@ class Session:
         Returns:
             list[str]: Names of all stored artifacts, sorted alphabetically.
         """
-        return sorted(self._artifacts.keys())
+        return self._artifact_names.copy()
 
     def get_artifact_size(self, name: str) -> int:
         """
@@ -541,16 +1033,16 @@ class Session:
         """
         # Get recent trajectory entries as dictionaries
         recent_entries = self.get_trajectory(limit=depth)
-        trajectory_dicts = [entry.to_dict() for entry in recent_entries]
+        trajectory_dicts = list(map(TrajectoryEntry.to_dict, recent_entries))
 
         # Create the snapshot (all values are deep copies)
         snapshot = {
             "session_id": self._session_id,
-            "state": copy.deepcopy(self._state),
+            "state": {key: _fast_deepcopy(value) for key, value in self._state.items()},
             "state_version": self._state_version,
             "trajectory": trajectory_dicts,
             "artifacts": self.list_artifacts(),
-            "snapshot_time": datetime.now(timezone.utc).isoformat(),
+            "snapshot_time": datetime.now(_UTC).isoformat(),
             "trajectory_total_length": self.get_trajectory_length(),
         }
 
@@ -571,6 +1063,11 @@ class Session:
         - Artifacts (all binary blobs)
 
         The save operation is atomic - either all data is written or none.
+        The file is written under a unique temporary name, flushed to disk
+        and renamed over path, so an existing session file is only ever
+        replaced by a complete one. If path is a symlink, the file it points
+        to is replaced and the link is kept; an existing file's permission
+        bits are carried over to the new file.
 
         Args:
             path: Path to save the session file. Will be overwritten if exists.
@@ -585,28 +1082,64 @@ class Session:
             agent_id="system",
             entry_type=EntryType.SESSION_SAVED,
             content={"path": str(path)},
+            trusted=True,
         )
 
-        # Create/overwrite the database file
-        # Using WAL mode for better concurrency, even though we're single-threaded
-        conn = sqlite3.connect(path)
-        try:
-            # Enable foreign keys and WAL mode
-            conn.execute("PRAGMA foreign_keys = ON")
-            conn.execute("PRAGMA journal_mode = WAL")
-
-            # Create schema
-            self._create_schema(conn)
-
-            # Save all data within a transaction
-            with conn:
-                self._save_metadata(conn)
-                self._save_state(conn)
-                self._save_trajectory(conn)
-                self._save_artifacts(conn)
+        # Build the database in a temporary file next to the target, then
+        # rename it into place. The rename is atomic, so readers see either
+        # the old file or the complete new one, and a crash mid-save leaves
+        # the old file untouched. mkstemp() picks a name no other writer is
+        # using, so concurrent saves to one path cannot share a temp file.
+        target = path.resolve()
+        fd, tmp_name = tempfile.mkstemp(
+            dir=target.parent, prefix=target.name, suffix=".tmp"
+        )
+        os.close(fd)
+        tmp_path = Path(tmp_name)
 
-        finally:
-            conn.close()
+        try:
+            conn = sqlite3.connect(tmp_path)
+            try:
+                # The temp file is discarded on failure and fsynced below
+                # before it is renamed, so it needs no on-disk journal and
+                # no per-commit syncs: keep the rollback journal in memory.
+                conn.execute("PRAGMA foreign_keys = ON")
+                conn.execute("PRAGMA journal_mode = MEMORY")
+                conn.execute("PRAGMA synchronous = NORMAL")
+                for pragma in _CONNECTION_PRAGMAS:
+                    conn.execute(pragma)
+
+                # Create schema
+                conn.executescript(_SCHEMA_SQL)
+
+                # Save all data within a single transaction. BEGIN IMMEDIATE
+                # takes the write lock up front, so every row below is written
+                # under one lock with one journal flush at commit.
+                with conn:
+                    if not conn.in_transaction:
+                        conn.execute("BEGIN IMMEDIATE")
+                    self._save_metadata(conn)
+                    self._save_state(conn)
+                    self._save_trajectory(conn)
+                    self._save_artifacts(conn)
+
+                # Let SQLite gather any statistics worth keeping for the
+                # freshly written tables before the file is closed
+                conn.execute("PRAGMA optimize")
+
+            finally:
+                conn.close()
+
+            os.chmod(tmp_path, _file_mode(target))
+            _fsync_path(tmp_path)
+            os.replace(tmp_path, target)
+            # Make the rename itself durable
+            if os.name == "posix":
+                _fsync_path(target.parent)
+
+        except BaseException:
+            tmp_path.unlink(missing_ok=True)
+            raise
 
     @classmethod
     def load(cls, path: str | Path) -> "Session":
@@ -633,6 +1166,9 @@ class Session:
 
         conn = sqlite3.connect(path)
         try:
+            for pragma in _CONNECTION_PRAGMAS:
+                conn.execute(pragma)
+
             # Load metadata first to get config
             session_id, max_artifact_size, state_version, workspace_path = cls._load_metadata(conn)
 
@@ -646,6 +1182,7 @@ class Session:
             # Clear the auto-created trajectory entry
             # We'll restore the original trajectory
             session._trajectory = []
+            session._entries_by_type = {}
             session._next_seq_num = 1
 
             # Restore state
@@ -654,59 +1191,32 @@ class Session:
 
             # Restore trajectory
             session._trajectory = cls._load_trajectory(conn)
+            session._index_entries(session._trajectory)
             if session._trajectory:
                 session._next_seq_num = session._trajectory[-1].seq_num + 1
 
             # Restore artifacts
+            # (rows arrive in name order, so the keys are already sorted)
             session._artifacts = cls._load_artifacts(conn)
-
-            # Record the load in trajectory
-            session._append_internal(
-                agent_id="system",
-                entry_type=EntryType.SESSION_LOADED,
-                content={"path": str(path)},
-            )
-
-            return session
+            session._artifact_names = list(session._artifacts)
 
         finally:
             conn.close()
 
+        # Record the load in trajectory
+        session._append_internal(
+            agent_id="system",
+            entry_type=EntryType.SESSION_LOADED,
+            content={"path": str(path)},
+            trusted=True,
+        )
+
+        return session
+
     # =========================================================================
     # PERSISTENCE HELPERS (PRIVATE)
     # =========================================================================
 
-    def _create_schema(self, conn: sqlite3.Connection) -> None:
-        """Create the database schema for session persistence."""
-        conn.executescript("""
-            -- Metadata table (single row)
-            CREATE TABLE IF NOT EXISTS metadata (
-                key TEXT PRIMARY KEY,
-                value TEXT NOT NULL
-            );
-
-            -- State table (key-value pairs)
-            CREATE TABLE IF NOT EXISTS state (
-                key TEXT PRIMARY KEY,
-                value_json TEXT NOT NULL
-            );
-
-            -- Trajectory table (append-only log)
-            CREATE TABLE IF NOT EXISTS trajectory (
-                seq_num INTEGER PRIMARY KEY,
-                timestamp TEXT NOT NULL,
-                agent_id TEXT NOT NULL,
-                entry_type TEXT NOT NULL,
-                content_json TEXT NOT NULL
-            );
-
-            -- Artifacts table (binary blobs)
-            CREATE TABLE IF NOT EXISTS artifacts (
-                name TEXT PRIMARY KEY,
-                data BLOB NOT NULL
-            );
-        """)
-
     def _save_metadata(self, conn: sqlite3.Connection) -> None:
         """Save session metadata."""
         metadata = {
@@ -716,46 +1226,45 @@ class Session:
             "state_version": str(self._state_version),
             "workspace_path": self._workspace_path or "",
         }
-        conn.execute("DELETE FROM metadata")
-        conn.executemany(
-            "INSERT INTO metadata (key, value) VALUES (?, ?)",
-            metadata.items(),
-        )
+        conn.executemany(_INSERT_METADATA_SQL, metadata.items())
 
     def _save_state(self, conn: sqlite3.Connection) -> None:
         """Save session state."""
-        conn.execute("DELETE FROM state")
         conn.executemany(
-            "INSERT INTO state (key, value_json) VALUES (?, ?)",
-            [(k, json.dumps(v)) for k, v in self._state.items()],
+            _INSERT_STATE_SQL,
+            ((k, _json.dumps(v)) for k, v in self._state.items()),
         )
 
     def _save_trajectory(self, conn: sqlite3.Connection) -> None:
         """Save trajectory entries."""
-        conn.execute("DELETE FROM trajectory")
         conn.executemany(
-            """INSERT INTO trajectory
-               (seq_num, timestamp, agent_id, entry_type, content_json)
-               VALUES (?, ?, ?, ?, ?)""",
-            [
+            _INSERT_TRAJECTORY_SQL,
+            (
                 (
                     e.seq_num,
-                    e.timestamp.isoformat(),
+                    # Exact integer arithmetic; no float rounding
+                    (e.timestamp - _EPOCH) // _ONE_MICROSECOND,
                     e.agent_id,
                     e.entry_type.value,
-                    json.dumps(e.content),
+                    _json.dumps(e.content),
                 )
                 for e in self._trajectory
-            ],
+            ),
         )
 
     def _save_artifacts(self, conn: sqlite3.Connection) -> None:
-        """Save artifacts."""
-        conn.execute("DELETE FROM artifacts")
-        conn.executemany(
-            "INSERT INTO artifacts (name, data) VALUES (?, ?)",
-            self._artifacts.items(),
-        )
+        """
+        Save artifacts.
+
+        Each row is created with a zeroblob of the right size and the bytes
+        are then written through incremental blob I/O, so large artifacts
+        are not bound as statement parameters.
+        """
+        for name, data in self._artifacts.items():
+            cursor = conn.execute(_INSERT_ARTIFACT_SQL, (name, len(data)))
+            if data:
+                with conn.blobopen("artifacts", "data", cursor.lastrowid) as blob:
+                    blob.write(data)
 
     @classmethod
     def _load_metadata(
@@ -767,12 +1276,12 @@ class Session:
         Returns:
             Tuple of (session_id, max_artifact_size, state_version, workspace_path)
         """
-        cursor = conn.execute("SELECT key, value FROM metadata")
+        cursor = conn.execute(_SELECT_METADATA_SQL)
         metadata = dict(cursor.fetchall())
 
         # Validate schema version
         schema_version = int(metadata.get("schema_version", "0"))
-        if schema_version != SCHEMA_VERSION:
+        if schema_version not in _READABLE_SCHEMA_VERSIONS:
             raise ValueError(
                 f"Schema version mismatch: file has {schema_version}, "
                 f"expected {SCHEMA_VERSION}"
@@ -788,35 +1297,41 @@ class Session:
     @classmethod
     def _load_state(cls, conn: sqlite3.Connection) -> dict[str, Any]:
         """Load session state."""
-        cursor = conn.execute("SELECT key, value_json FROM state")
-        return {key: json.loads(value_json) for key, value_json in cursor.fetchall()}
+        cursor = conn.execute(_SELECT_STATE_SQL)
+        return {key: _json.loads(value_json) for key, value_json in cursor.fetchall()}
 
     @classmethod
     def _load_trajectory(cls, conn: sqlite3.Connection) -> list[TrajectoryEntry]:
         """Load trajectory entries."""
-        cursor = conn.execute(
-            """SELECT seq_num, timestamp, agent_id, entry_type, content_json
-               FROM trajectory ORDER BY seq_num"""
-        )
+        cursor = conn.execute(_SELECT_TRAJECTORY_SQL)
         entries = []
         for row in cursor.fetchall():
             seq_num, timestamp, agent_id, entry_type, content_json = row
+            # Version 1 files store ISO-8601 text instead of microseconds
+            if isinstance(timestamp, str):
+                timestamp = datetime.fromisoformat(timestamp)
+            else:
+                timestamp = _EPOCH + timedelta(microseconds=timestamp)
+            # Entries were validated when first appended; skip re-checking
             entries.append(
-                TrajectoryEntry(
-                    seq_num=seq_num,
-                    timestamp=datetime.fromisoformat(timestamp),
-                    agent_id=agent_id,
-                    entry_type=EntryType(entry_type),
-                    content=json.loads(content_json),
+                TrajectoryEntry._unchecked(
+                    seq_num,
+                    timestamp,
+                    agent_id,
+                    EntryType(entry_type),
+                    _json.loads(content_json),
                 )
             )
         return entries
 
     @classmethod
     def _load_artifacts(cls, conn: sqlite3.Connection) -> dict[str, bytes]:
-        """Load artifacts."""
-        cursor = conn.execute("SELECT name, data FROM artifacts")
-        return {name: data for name, data in cursor.fetchall()}
+        """Load artifacts, reading each blob directly via incremental blob I/O."""
+        artifacts = {}
+        for rowid, name in conn.execute(_SELECT_ARTIFACTS_SQL).fetchall():
+            with conn.blobopen("artifacts", "data", rowid, readonly=True) as blob:
+                artifacts[name] = blob.read()
+        return artifacts
 
     # =========================================================================
     # DEBUGGING / INTROSPECTION
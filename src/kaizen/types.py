@@ -12,6 +12,8 @@ The types defined here form the "vocabulary" of the system - they are the
 building blocks that sessions, agents, and dispatchers communicate with.
 """
 
+import copy
+import sys
 from dataclasses import dataclass, field
 from datetime import datetime, timezone
 from enum import Enum
@@ -63,6 +65,33 @@ class EntryType(str, Enum):
     SYSTEM_NOTE = "system_note"             # System-generated note/log
 
 
+# Interned string value of each entry type. Enum's .value is a descriptor
+# lookup costing roughly ten times a dict lookup, and serialization reads
+# it once per trajectory entry.
+_ENTRY_TYPE_VALUES: dict[EntryType, str] = {
+    entry_type: sys.intern(entry_type.value) for entry_type in EntryType
+}
+
+# Reverse mapping for deserialization. EntryType(value) goes through Enum's
+# generic lookup machinery, about ten times slower than a dict lookup.
+_ENTRY_TYPE_BY_VALUE: dict[str, EntryType] = {
+    value: entry_type for entry_type, value in _ENTRY_TYPE_VALUES.items()
+}
+
+
+def _entry_type_from_value(value: str) -> EntryType:
+    """
+    Return the EntryType with the given value.
+
+    Raises:
+        ValueError: If no entry type has that value, as EntryType(value) does.
+    """
+    try:
+        return _ENTRY_TYPE_BY_VALUE[value]
+    except KeyError:
+        return EntryType(value)
+
+
 class ErrorCode(str, Enum):
     """
     Standard error codes for Kaizen operations.
@@ -115,13 +144,32 @@ class ErrorCode(str, Enum):
     VALIDATION_ERROR = "validation_error"
 
 
+# String value of each error code, used by InvokeResult.fail()
+_ERROR_CODE_VALUES: dict[ErrorCode, str] = {
+    error_code: sys.intern(error_code.value) for error_code in ErrorCode
+}
+
+
 # =============================================================================
 # TRAJECTORY ENTRY
 # =============================================================================
 
 
-@dataclass(frozen=True)
-class TrajectoryEntry:
+class _DictCacheSlot:
+    """
+    Base class holding a cached to_dict() result in a private slot.
+
+    The slot lives outside the dataclass fields, so the cache does not
+    show up in fields(), asdict(), replace() or the generated __init__.
+    It is left unset until the first to_dict() call; it is also unset
+    after unpickling, which restores fields only.
+    """
+
+    __slots__ = ("_dict_cache",)
+
+
+@dataclass(frozen=True, slots=True)
+class TrajectoryEntry(_DictCacheSlot):
     """
     An immutable record of an action or event in a session's trajectory.
 
@@ -166,21 +214,63 @@ class TrajectoryEntry:
         """
         Validate the entry after initialization.
 
-        Since the dataclass is frozen, we can't modify values here,
-        but we can raise errors for invalid data.
+        Since the dataclass is frozen, values are not normally modified
+        here. The one exception is agent_id, which is interned because a
+        trajectory repeats a handful of agent IDs many times.
         """
         # Validate seq_num is positive
         if self.seq_num < 1:
             raise ValueError(f"seq_num must be >= 1, got {self.seq_num}")
 
         # Validate agent_id is not empty
-        if not self.agent_id or not self.agent_id.strip():
+        if not self.agent_id or self.agent_id.isspace():
             raise ValueError("agent_id cannot be empty")
 
         # Validate timestamp has timezone info (should be UTC)
         if self.timestamp.tzinfo is None:
             raise ValueError("timestamp must be timezone-aware (use UTC)")
 
+        # Share one string object per distinct agent_id so equality checks
+        # against it hit CPython's identity fast path.
+        object.__setattr__(self, "agent_id", sys.intern(self.agent_id))
+
+    @classmethod
+    def _unchecked(
+        cls,
+        seq_num: int,
+        timestamp: datetime,
+        agent_id: str,
+        entry_type: EntryType,
+        content: dict[str, Any],
+    ) -> "TrajectoryEntry":
+        """
+        Create an entry from fields already known to be valid.
+
+        Skips the checks in __post_init__. Only for fields that were
+        validated when an entry was first created: copies of entries, and
+        entries read back from a session file written by save(). agent_id
+        is still interned.
+        """
+        entry = object.__new__(cls)
+        object.__setattr__(entry, "seq_num", seq_num)
+        object.__setattr__(entry, "timestamp", timestamp)
+        object.__setattr__(entry, "agent_id", sys.intern(agent_id))
+        object.__setattr__(entry, "entry_type", entry_type)
+        object.__setattr__(entry, "content", content)
+        return entry
+
+    def _with_content(self, content: dict[str, Any]) -> "TrajectoryEntry":
+        """Return a copy of this entry with its content replaced."""
+        return self._unchecked(
+            self.seq_num, self.timestamp, self.agent_id, self.entry_type, content
+        )
+
+    def __deepcopy__(self, memo: dict[int, Any]) -> "TrajectoryEntry":
+        """Deep-copy the entry; only its content is mutable and needs copying."""
+        clone = self._with_content(copy.deepcopy(self.content, memo))
+        memo[id(self)] = clone
+        return clone
+
     def to_dict(self) -> dict[str, Any]:
         """
         Convert the entry to a JSON-serializable dictionary.
@@ -188,16 +278,25 @@ class TrajectoryEntry:
         This is used for persistence and for creating snapshots.
         The timestamp is serialized as an ISO format string.
 
+        The dictionary is built once and cached on the entry, since agent
+        snapshots serialize the same recent entries over and over. Each
+        call returns a new copy of the cached dictionary.
+
         Returns:
             dict: JSON-serializable representation of the entry.
         """
-        return {
-            "seq_num": self.seq_num,
-            "timestamp": self.timestamp.isoformat(),
-            "agent_id": self.agent_id,
-            "entry_type": self.entry_type.value,
-            "content": self.content,
-        }
+        # Entries are immutable, so the cached form never goes stale
+        cached = getattr(self, "_dict_cache", None)
+        if cached is None:
+            cached = {
+                "seq_num": self.seq_num,
+                "timestamp": self.timestamp.isoformat(),
+                "agent_id": self.agent_id,
+                "entry_type": _ENTRY_TYPE_VALUES[self.entry_type],
+                "content": self.content,
+            }
+            object.__setattr__(self, "_dict_cache", cached)
+        return cached.copy()
 
     @classmethod
     def from_dict(cls, data: dict[str, Any]) -> "TrajectoryEntry":
@@ -221,7 +320,7 @@ class TrajectoryEntry:
             seq_num=data["seq_num"],
             timestamp=datetime.fromisoformat(data["timestamp"]),
             agent_id=data["agent_id"],
-            entry_type=EntryType(data["entry_type"]),
+            entry_type=_entry_type_from_value(data["entry_type"]),
             content=data["content"],
         )
 
@@ -231,7 +330,7 @@ class TrajectoryEntry:
 # =============================================================================
 
 
-@dataclass(frozen=True)
+@dataclass(frozen=True, slots=True)
 class InvokeResult:
     """
     The result of invoking an agent capability.
@@ -349,7 +448,7 @@ class InvokeResult:
             InvokeResult: A failed result.
         """
         error = {
-            "error_code": error_code.value,
+            "error_code": _ERROR_CODE_VALUES[error_code],
             "message": message,
         }
         if details:
@@ -384,8 +483,18 @@ class InvokeResult:
 # =============================================================================
 
 
-@dataclass(frozen=True)
-class CapabilityCall:
+def _shallow_asdict(obj: Any) -> dict[str, Any]:
+    """
+    Map a slotted dataclass's fields to their values.
+
+    Unlike dataclasses.asdict, field values are not copied or recursed
+    into; they are already JSON-ready here.
+    """
+    return {name: getattr(obj, name) for name in obj.__slots__}
+
+
+@dataclass(frozen=True, slots=True)
+class CapabilityCall(_DictCacheSlot):
     """
     A request to invoke a specific capability with parameters.
 
@@ -408,20 +517,24 @@ class CapabilityCall:
 
     def __post_init__(self) -> None:
         """Validate the call after initialization."""
-        if not self.capability or not self.capability.strip():
+        if not self.capability or self.capability.isspace():
             raise ValueError("capability cannot be empty")
 
     def to_dict(self) -> dict[str, Any]:
         """
         Convert to a JSON-serializable dictionary.
 
+        The dictionary is built once and cached; each call returns a new
+        copy of it.
+
         Returns:
             dict: Dictionary with capability and params.
         """
-        return {
-            "capability": self.capability,
-            "params": self.params,
-        }
+        cached = getattr(self, "_dict_cache", None)
+        if cached is None:
+            cached = _shallow_asdict(self)
+            object.__setattr__(self, "_dict_cache", cached)
+        return cached.copy()
 
     @classmethod
     def from_dict(cls, data: dict[str, Any]) -> "CapabilityCall":
@@ -434,9 +547,12 @@ class CapabilityCall:
         Returns:
             CapabilityCall: The constructed call.
         """
+        # Only a missing or null params value means no parameters; any
+        # other value is passed through as given
+        params = data.get("params")
         return cls(
             capability=data["capability"],
-            params=data.get("params", {}),
+            params={} if params is None else params,
         )
 
 
@@ -445,8 +561,8 @@ class CapabilityCall:
 # =============================================================================
 
 
-@dataclass(frozen=True)
-class AgentInfo:
+@dataclass(frozen=True, slots=True)
+class AgentInfo(_DictCacheSlot):
     """
     Metadata about an agent.
 
@@ -479,10 +595,10 @@ class AgentInfo:
 
     def __post_init__(self) -> None:
         """Validate agent info after initialization."""
-        if not self.agent_id or not self.agent_id.strip():
+        if not self.agent_id or self.agent_id.isspace():
             raise ValueError("agent_id cannot be empty")
 
-        if not self.name or not self.name.strip():
+        if not self.name or self.name.isspace():
             raise ValueError("name cannot be empty")
 
         if not self.capabilities:
@@ -492,13 +608,16 @@ class AgentInfo:
         """
         Convert to a JSON-serializable dictionary.
 
+        The dictionary is built once and cached; each call returns a new
+        copy of it, with a copy of the capabilities list.
+
         Returns:
             dict: Dictionary representation.
         """
-        return {
-            "agent_id": self.agent_id,
-            "name": self.name,
-            "version": self.version,
-            "capabilities": self.capabilities,
-            "description": self.description,
-        }
+        cached = getattr(self, "_dict_cache", None)
+        if cached is None:
+            cached = _shallow_asdict(self)
+            object.__setattr__(self, "_dict_cache", cached)
+        data = cached.copy()
+        data["capabilities"] = list(self.capabilities)
+        return data
@@ -9,12 +9,20 @@ Fixtures:
 - temp_session_path: Provides a temporary file path for session persistence tests
 - sample_trajectory_entries: Sample trajectory data for testing
 - sample_state_data: Sample state data for testing
+- mock_httpx: Routes httpx.Client through a mock transport for LLM provider tests
+- shared_httpx_client: One pooled httpx.Client for integration tests
 """
 
+import contextlib
+import functools
+import json
+import os
 import tempfile
 from pathlib import Path
-from typing import Generator
+from typing import Any, Callable, Generator
+from unittest import mock
 
+import httpx
 import pytest
 
 
@@ -22,6 +30,14 @@ import pytest
 # PATH FIXTURES
 # =============================================================================
 
+# RAM-backed directory for temporary session files, when the platform has a
+# writable one (Linux tmpfs). Persistence tests save and load many SQLite
+# files, so keeping them off the real disk keeps the suite fast. None falls
+# back to the system default temp directory.
+_RAM_TMP_ROOT: str | None = (
+    "/dev/shm" if os.path.isdir("/dev/shm") and os.access("/dev/shm", os.W_OK) else None
+)
+
 
 @pytest.fixture
 def temp_session_path() -> Generator[Path, None, None]:
@@ -29,7 +45,8 @@ def temp_session_path() -> Generator[Path, None, None]:
     Provides a temporary file path for session persistence tests.
 
     The file is automatically cleaned up after the test completes,
-    whether it passes or fails.
+    whether it passes or fails. It lives on tmpfs (/dev/shm) when that
+    is available.
 
     Yields:
         Path: A path to a temporary .kaizen file that can be used for
@@ -42,7 +59,7 @@ def temp_session_path() -> Generator[Path, None, None]:
             loaded = Session.load(temp_session_path)
     """
     # Create a temporary directory that will be cleaned up automatically
-    with tempfile.TemporaryDirectory() as tmpdir:
+    with tempfile.TemporaryDirectory(prefix="kaizen-tests-", dir=_RAM_TMP_ROOT) as tmpdir:
         # Yield a path within the temp directory
         # The .kaizen extension is conventional for kaizen session files
         yield Path(tmpdir) / "test_session.kaizen"
@@ -57,7 +74,7 @@ def temp_dir() -> Generator[Path, None, None]:
         Path: Path to a temporary directory that will be cleaned up
               after the test.
     """
-    with tempfile.TemporaryDirectory() as tmpdir:
+    with tempfile.TemporaryDirectory(prefix="kaizen-tests-", dir=_RAM_TMP_ROOT) as tmpdir:
         yield Path(tmpdir)
 
 
@@ -152,6 +169,90 @@ def large_artifact_data() -> bytes:
     return b"X" * (1024 * 1024)
 
 
+# =============================================================================
+# HTTP MOCK FIXTURES
+# =============================================================================
+
+
+# Response headers for mock_httpx JSON bodies
+_JSON_HEADERS = {"Content-Type": "application/json"}
+
+
+@pytest.fixture
+def mock_httpx() -> Generator[Callable[..., None], None, None]:
+    """
+    Factory fixture that routes every httpx.Client through a mock transport.
+
+    Call the returned function to install the mock for the current test.
+    Providers keep using real httpx.Client objects, but the transport is an
+    httpx.MockTransport, so no network I/O happens. Each request either
+    raises exc or gets a response with the given JSON body and status code.
+
+    Args (of the returned function):
+        json_data: JSON body of the response.
+        status: HTTP status code. Codes >= 400 make raise_for_status() raise.
+        exc: Exception raised by the transport instead of responding.
+        capture: Optional dict that receives the url, payload and headers
+                 of the last request.
+
+    Example:
+        def test_complete(mock_httpx):
+            captured = {}
+            mock_httpx(json_data={"response": "OK"}, capture=captured)
+            OllamaProvider().complete("Prompt")
+            assert captured["payload"]["prompt"] == "Prompt"
+    """
+    real_client = httpx.Client
+
+    # Patches are entered lazily by _install() and all undone at teardown
+    stack = contextlib.ExitStack()
+
+    def _install(
+        json_data: Any = None,
+        status: int = 200,
+        exc: Exception | None = None,
+        capture: dict[str, Any] | None = None,
+    ) -> None:
+        # Encode the body once per install. A Response is consumed once
+        # read, so each request still wraps the bytes in a fresh one.
+        body = json.dumps(json_data).encode()
+
+        def handler(request: httpx.Request) -> httpx.Response:
+            if capture is not None:
+                capture["url"] = str(request.url)
+                capture["payload"] = json.loads(request.content) if request.content else None
+                capture["headers"] = request.headers
+            if exc is not None:
+                raise exc
+            return httpx.Response(status, content=body, headers=_JSON_HEADERS)
+
+        transport = httpx.MockTransport(handler)
+        stack.enter_context(
+            mock.patch.object(
+                httpx, "Client", functools.partial(real_client, transport=transport)
+            )
+        )
+
+    with stack:
+        yield _install
+
+
+@pytest.fixture(scope="session")
+def shared_httpx_client() -> Generator[httpx.Client, None, None]:
+    """
+    Provides one real httpx.Client for the whole test session.
+
+    Integration tests pass this to providers via client= so that repeated
+    requests to the same server reuse pooled connections instead of
+    opening a new TCP/TLS connection per test.
+
+    Yields:
+        httpx.Client: A client that is closed when the session ends.
+    """
+    with httpx.Client(timeout=120.0, follow_redirects=True) as client:
+        yield client
+
+
 # =============================================================================
 # MARKER CONFIGURATION
 # =============================================================================
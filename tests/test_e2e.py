@@ -234,12 +234,7 @@ class TestResumeAfterFailure:
         restored2.set("counter", 2)
 
         # Check trajectory is continuous
-        trajectory = restored2.get_trajectory()
-        seq_nums = [e.seq_num for e in trajectory]
-
-        # Should be consecutive
-        for i in range(1, len(seq_nums)):
-            assert seq_nums[i] == seq_nums[i - 1] + 1
+        assert restored2.is_trajectory_contiguous()
 
 
 class TestReplayAndInspection:
@@ -415,6 +410,7 @@ class TestArtifactWorkflow:
 
 
 @pytest.mark.integration
+@pytest.mark.xdist_group("ollama")
 class TestRealLLMWorkflow:
     """Integration tests with real LLM (requires Ollama)."""
 
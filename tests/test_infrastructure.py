@@ -9,7 +9,7 @@ These tests should always pass and provide confidence that the testing
 framework is operational before writing substantive tests.
 """
 
-import sys
+import importlib.util
 from pathlib import Path
 
 import pytest
@@ -55,13 +55,11 @@ class TestProjectStructure:
         This is essential for the package to be importable during tests
         without installation.
         """
-        # Find paths that contain 'kaizen' as a package
-        kaizen_paths = [p for p in sys.path if "kaizen" in str(p).lower()]
+        # Resolve the package location without executing kaizen/__init__.py
+        spec = importlib.util.find_spec("kaizen")
 
-        # At minimum, the test should be able to import kaizen
-        # (which we verified above), but let's also check the path setup
-        import kaizen
-        kaizen_file = kaizen.__file__
+        assert spec is not None
+        kaizen_file = spec.origin
 
         assert kaizen_file is not None
         assert "src/kaizen" in kaizen_file or "src\\kaizen" in kaizen_file
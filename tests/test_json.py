@@ -0,0 +1,53 @@
+"""
+Tests for the internal JSON helpers.
+
+kaizen._json uses orjson for parsing when it is installed and the
+standard library otherwise. Both paths must decode exactly what
+json.dumps produced, since that is what Session.set() validates against.
+"""
+
+import math
+
+import pytest
+
+from kaizen import _json
+
+
+@pytest.fixture(params=["orjson", "stdlib"])
+def json_backend(request: pytest.FixtureRequest, monkeypatch: pytest.MonkeyPatch) -> str:
+    """Run a test with orjson (if installed) and with the stdlib fallback."""
+    if request.param == "orjson":
+        if _json.orjson is None:
+            pytest.skip("orjson not installed")
+    else:
+        monkeypatch.setattr(_json, "orjson", None)
+    return request.param
+
+
+class TestJsonHelpers:
+    """Tests for kaizen._json.dumps/loads."""
+
+    def test_dumps_is_compact(self) -> None:
+        """Verify dumps() omits separator padding."""
+        assert _json.dumps({"a": [1, 2]}) == '{"a":[1,2]}'
+
+    def test_roundtrip(self, json_backend: str) -> None:
+        """Verify nested values survive dumps/loads."""
+        value = {"text": "héllo", "n": 2**70, "items": [1.5, None, True], "nested": {}}
+        assert _json.loads(_json.dumps(value)) == value
+
+    def test_loads_accepts_bytes(self, json_backend: str) -> None:
+        """Verify loads() accepts UTF-8 bytes as well as str."""
+        assert _json.loads(b'{"a":1}') == {"a": 1}
+
+    def test_non_finite_floats_roundtrip(self, json_backend: str) -> None:
+        """Verify NaN/Infinity written by json.dumps are decoded back."""
+        loaded = _json.loads(_json.dumps([math.inf, math.nan]))
+
+        assert loaded[0] == math.inf
+        assert math.isnan(loaded[1])
+
+    def test_loads_invalid_raises(self, json_backend: str) -> None:
+        """Verify invalid JSON raises json.JSONDecodeError (a ValueError)."""
+        with pytest.raises(ValueError):
+            _json.loads("{not json")
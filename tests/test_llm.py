@@ -6,11 +6,13 @@ This module tests:
 - LLMResponse dataclass
 - LLMError exception
 - OllamaProvider (with mocked HTTP calls)
+- Protocol and base class conformance of all providers
 
 Integration tests that require a running Ollama server are marked
 with @pytest.mark.integration and skipped by default.
 """
 
+import httpx
 import pytest
 
 from kaizen.llm import (
@@ -19,9 +21,66 @@ from kaizen.llm import (
     LLMResponse,
     LLMError,
     OllamaProvider,
+    OpenAICompatProvider,
 )
 
 
+# Canned /api/generate response bodies. Treated as read-only by tests.
+OLLAMA_OK = {"response": "OK", "model": "test"}
+OLLAMA_OK_WITH_USAGE = {
+    "response": "Hello, world!",
+    "model": "llama3.1:8b",
+    "prompt_eval_count": 10,
+    "eval_count": 5,
+}
+
+# Factories for every concrete provider, keyed by the name used in test IDs
+PROVIDER_FACTORIES = {
+    "ollama": OllamaProvider,
+    "openai_compat": lambda: OpenAICompatProvider(base_url="http://localhost:8000"),
+}
+
+
+# =============================================================================
+# FIXTURES
+# =============================================================================
+
+
+@pytest.fixture(scope="module")
+def ollama_provider() -> OllamaProvider:
+    """
+    Default-config OllamaProvider shared by the tests in this module.
+
+    Providers hold no per-request state, so tests that only need the
+    defaults can share one instance. Tests that need custom config
+    construct their own.
+    """
+    return OllamaProvider()
+
+
+@pytest.fixture
+def provider(request: pytest.FixtureRequest) -> LLMProvider:
+    """
+    Build the provider named by the indirect parameter.
+
+    Use with @pytest.mark.parametrize("provider", [...], indirect=True)
+    and names from PROVIDER_FACTORIES. Only the requested provider is
+    constructed.
+    """
+    return PROVIDER_FACTORIES[request.param]()
+
+
+@pytest.fixture(scope="session")
+def ollama_available(shared_httpx_client) -> bool:
+    """
+    Whether a local Ollama server is reachable, probed once per session.
+
+    Integration tests use this to decide whether to skip, instead of each
+    test sending its own availability request.
+    """
+    return OllamaProvider(client=shared_httpx_client).is_available()
+
+
 # =============================================================================
 # LLM RESPONSE TESTS
 # =============================================================================
@@ -118,206 +177,113 @@ class TestLLMError:
 
 
 # =============================================================================
-# OLLAMA PROVIDER TESTS (MOCKED)
+# PROVIDER CONFORMANCE TESTS
 # =============================================================================
 
 
-class TestOllamaProviderConfig:
-    """Tests for OllamaProvider configuration."""
+@pytest.mark.parametrize("provider", list(PROVIDER_FACTORIES), indirect=True)
+@pytest.mark.parametrize("base", [LLMProvider, LLMProviderProtocol])
+def test_provider_conformance(provider, base) -> None:
+    """Verify every provider is an LLMProvider and satisfies the protocol."""
+    assert isinstance(provider, base)
 
-    def test_default_config(self) -> None:
-        """Verify default configuration."""
-        provider = OllamaProvider()
 
-        assert provider.model_name == "llama3.1:8b"
-        assert provider.base_url == "http://localhost:11434"
-
-    def test_custom_model(self) -> None:
-        """Verify custom model configuration."""
-        provider = OllamaProvider(model="mistral:7b")
-
-        assert provider.model_name == "mistral:7b"
+# =============================================================================
+# OLLAMA PROVIDER TESTS (MOCKED)
+# =============================================================================
 
-    def test_custom_base_url(self) -> None:
-        """Verify custom base URL configuration."""
-        provider = OllamaProvider(base_url="http://gpu-server:11434")
 
-        assert provider.base_url == "http://gpu-server:11434"
+def test_ollama_default_config(ollama_provider) -> None:
+    """Verify default OllamaProvider configuration."""
+    assert ollama_provider.model_name == "llama3.1:8b"
+    assert ollama_provider.base_url == "http://localhost:11434"
 
-    def test_base_url_strips_trailing_slash(self) -> None:
-        """Verify trailing slash is stripped from base URL."""
-        provider = OllamaProvider(base_url="http://localhost:11434/")
 
-        assert provider.base_url == "http://localhost:11434"
+@pytest.mark.parametrize(
+    "kwargs, attr, expected",
+    [
+        ({"model": "mistral:7b"}, "model_name", "mistral:7b"),
+        ({"base_url": "http://gpu-server:11434"}, "base_url", "http://gpu-server:11434"),
+        ({"base_url": "http://localhost:11434/"}, "base_url", "http://localhost:11434"),
+    ],
+    ids=["custom_model", "custom_base_url", "strips_trailing_slash"],
+)
+def test_ollama_config(kwargs, attr, expected) -> None:
+    """Verify OllamaProvider applies custom configuration."""
+    provider = OllamaProvider(**kwargs)
 
-    def test_repr(self) -> None:
-        """Verify __repr__ returns useful string."""
-        provider = OllamaProvider(model="test:7b")
+    assert getattr(provider, attr) == expected
 
-        repr_str = repr(provider)
-        assert "OllamaProvider" in repr_str
-        assert "test:7b" in repr_str
 
-    def test_implements_protocol(self) -> None:
-        """Verify OllamaProvider implements LLMProviderProtocol."""
-        provider = OllamaProvider()
-        assert isinstance(provider, LLMProviderProtocol)
+def test_ollama_repr() -> None:
+    """Verify __repr__ returns useful string."""
+    provider = OllamaProvider(model="test:7b")
 
-    def test_is_llm_provider(self) -> None:
-        """Verify OllamaProvider is an LLMProvider."""
-        provider = OllamaProvider()
-        assert isinstance(provider, LLMProvider)
+    repr_str = repr(provider)
+    assert "OllamaProvider" in repr_str
+    assert "test:7b" in repr_str
 
 
 class TestOllamaProviderMocked:
     """Tests for OllamaProvider with mocked HTTP."""
 
-    def test_complete_success(self, monkeypatch) -> None:
-        """Verify complete() handles successful response."""
-        # Mock httpx.Client
-        class MockResponse:
-            status_code = 200
-            def raise_for_status(self):
-                pass
-            def json(self):
-                return {
-                    "response": "Hello, world!",
-                    "model": "llama3.1:8b",
-                    "prompt_eval_count": 10,
-                    "eval_count": 5,
-                }
-
-        class MockClient:
-            def __init__(self, **kwargs):
-                pass
-            def __enter__(self):
-                return self
-            def __exit__(self, *args):
-                pass
-            def post(self, url, json):
-                return MockResponse()
-
-        import httpx
-        monkeypatch.setattr(httpx, "Client", MockClient)
-
-        provider = OllamaProvider()
-        response = provider.complete("Test prompt")
+    @pytest.mark.parametrize(
+        "system", [None, "System message"], ids=["no_system", "with_system"]
+    )
+    def test_complete_success(self, mock_httpx, ollama_provider, system) -> None:
+        """Verify complete() sends the prompt payload and parses the response."""
+        captured = {}
+        mock_httpx(json_data=OLLAMA_OK_WITH_USAGE, capture=captured)
+
+        response = ollama_provider.complete("Prompt", system=system)
 
         assert response.text == "Hello, world!"
         assert response.model == "llama3.1:8b"
         assert response.input_tokens == 10
         assert response.output_tokens == 5
 
-    def test_complete_with_system(self, monkeypatch) -> None:
-        """Verify complete() includes system message."""
-        captured_payload = {}
-
-        class MockResponse:
-            status_code = 200
-            def raise_for_status(self):
-                pass
-            def json(self):
-                return {"response": "OK", "model": "test"}
-
-        class MockClient:
-            def __init__(self, **kwargs):
-                pass
-            def __enter__(self):
-                return self
-            def __exit__(self, *args):
-                pass
-            def post(self, url, json):
-                captured_payload.update(json)
-                return MockResponse()
-
-        import httpx
-        monkeypatch.setattr(httpx, "Client", MockClient)
-
-        provider = OllamaProvider()
-        provider.complete("Prompt", system="System message")
-
-        assert captured_payload["system"] == "System message"
-        assert captured_payload["prompt"] == "Prompt"
-
-    def test_complete_connection_error(self, monkeypatch) -> None:
-        """Verify complete() handles connection errors."""
-        import httpx
-
-        class MockClient:
-            def __init__(self, **kwargs):
-                pass
-            def __enter__(self):
-                return self
-            def __exit__(self, *args):
-                pass
-            def post(self, url, json):
-                raise httpx.ConnectError("Connection refused")
-
-        monkeypatch.setattr(httpx, "Client", MockClient)
-
-        provider = OllamaProvider()
+        payload = captured["payload"]
+        assert payload["prompt"] == "Prompt"
+        assert payload.get("system") == system
+
+    @pytest.mark.parametrize(
+        "mock_kwargs, expected_substr",
+        [
+            ({"exc": httpx.ConnectError("Connection refused")}, "Cannot connect"),
+            ({"exc": httpx.TimeoutException("Timeout")}, "timed out"),
+            ({"status": 404}, "ollama pull"),
+        ],
+        ids=["connection_error", "timeout", "model_not_found"],
+    )
+    def test_complete_error(
+        self, mock_httpx, ollama_provider, mock_kwargs, expected_substr
+    ) -> None:
+        """Verify complete() maps transport and HTTP failures to LLMError."""
+        mock_httpx(**mock_kwargs)
 
         with pytest.raises(LLMError) as exc_info:
-            provider.complete("Test")
+            ollama_provider.complete("Test")
 
-        assert "Cannot connect" in exc_info.value.message
+        assert expected_substr in exc_info.value.message
         assert exc_info.value.provider == "ollama"
 
-    def test_complete_timeout(self, monkeypatch) -> None:
-        """Verify complete() handles timeouts."""
-        import httpx
+    def test_complete_with_shared_client(self) -> None:
+        """Verify complete() sends through a caller-supplied client."""
+        requests = []
 
-        class MockClient:
-            def __init__(self, **kwargs):
-                pass
-            def __enter__(self):
-                return self
-            def __exit__(self, *args):
-                pass
-            def post(self, url, json):
-                raise httpx.TimeoutException("Timeout")
+        def handler(request: httpx.Request) -> httpx.Response:
+            requests.append(request)
+            return httpx.Response(200, json=OLLAMA_OK)
 
-        monkeypatch.setattr(httpx, "Client", MockClient)
+        with httpx.Client(transport=httpx.MockTransport(handler)) as client:
+            provider = OllamaProvider(client=client)
+            provider.complete("First")
+            provider.complete("Second")
 
-        provider = OllamaProvider()
-
-        with pytest.raises(LLMError) as exc_info:
-            provider.complete("Test")
-
-        assert "timed out" in exc_info.value.message
-
-    def test_complete_model_not_found(self, monkeypatch) -> None:
-        """Verify complete() handles 404 for missing model."""
-        import httpx
-
-        class MockResponse:
-            status_code = 404
-            def raise_for_status(self):
-                raise httpx.HTTPStatusError(
-                    "Not found",
-                    request=None,
-                    response=self,
-                )
-
-        class MockClient:
-            def __init__(self, **kwargs):
-                pass
-            def __enter__(self):
-                return self
-            def __exit__(self, *args):
-                pass
-            def post(self, url, json):
-                return MockResponse()
-
-        monkeypatch.setattr(httpx, "Client", MockClient)
-
-        provider = OllamaProvider(model="nonexistent:7b")
-
-        with pytest.raises(LLMError) as exc_info:
-            provider.complete("Test")
+            # The provider must leave the caller's client open
+            assert not client.is_closed
 
-        assert "not found" in exc_info.value.message
-        assert "ollama pull" in exc_info.value.message
+        assert [r.url.path for r in requests] == ["/api/generate", "/api/generate"]
 
 
 # =============================================================================
@@ -328,111 +294,27 @@ class TestOllamaProviderMocked:
 class TestOllamaProviderKwargs:
     """Tests for per-call kwargs in OllamaProvider."""
 
-    def test_complete_with_kwargs(self, monkeypatch) -> None:
-        """Verify complete() passes recognized kwargs to Ollama options."""
-        captured_payload = {}
-
-        class MockResponse:
-            status_code = 200
-            def raise_for_status(self): pass
-            def json(self):
-                return {"response": "OK", "model": "test"}
-
-        class MockClient:
-            def __init__(self, **kwargs): pass
-            def __enter__(self): return self
-            def __exit__(self, *args): pass
-            def post(self, url, json):
-                captured_payload.update(json)
-                return MockResponse()
-
-        import httpx
-        monkeypatch.setattr(httpx, "Client", MockClient)
-
-        provider = OllamaProvider()
-        provider.complete("Prompt", temperature=0.5, max_tokens=100)
-
-        assert captured_payload["options"]["temperature"] == 0.5
-        assert captured_payload["options"]["num_predict"] == 100
-
-    def test_complete_maps_max_tokens_to_num_predict(self, monkeypatch) -> None:
-        """Verify max_tokens is mapped to Ollama's num_predict."""
-        captured_payload = {}
-
-        class MockResponse:
-            status_code = 200
-            def raise_for_status(self): pass
-            def json(self):
-                return {"response": "OK", "model": "test"}
-
-        class MockClient:
-            def __init__(self, **kwargs): pass
-            def __enter__(self): return self
-            def __exit__(self, *args): pass
-            def post(self, url, json):
-                captured_payload.update(json)
-                return MockResponse()
-
-        import httpx
-        monkeypatch.setattr(httpx, "Client", MockClient)
-
-        provider = OllamaProvider()
-        provider.complete("Prompt", max_tokens=256)
-
-        assert "max_tokens" not in captured_payload.get("options", {})
-        assert captured_payload["options"]["num_predict"] == 256
-
-    def test_complete_ignores_unknown_kwargs(self, monkeypatch) -> None:
-        """Verify complete() silently ignores unrecognized kwargs."""
-        captured_payload = {}
-
-        class MockResponse:
-            status_code = 200
-            def raise_for_status(self): pass
-            def json(self):
-                return {"response": "OK", "model": "test"}
-
-        class MockClient:
-            def __init__(self, **kwargs): pass
-            def __enter__(self): return self
-            def __exit__(self, *args): pass
-            def post(self, url, json):
-                captured_payload.update(json)
-                return MockResponse()
-
-        import httpx
-        monkeypatch.setattr(httpx, "Client", MockClient)
-
-        provider = OllamaProvider()
-        provider.complete("Prompt", unknown_param="should be ignored")
-
-        assert "options" not in captured_payload
-
-    def test_complete_no_kwargs_no_options(self, monkeypatch) -> None:
-        """Verify no options key when no kwargs passed."""
-        captured_payload = {}
-
-        class MockResponse:
-            status_code = 200
-            def raise_for_status(self): pass
-            def json(self):
-                return {"response": "OK", "model": "test"}
-
-        class MockClient:
-            def __init__(self, **kwargs): pass
-            def __enter__(self): return self
-            def __exit__(self, *args): pass
-            def post(self, url, json):
-                captured_payload.update(json)
-                return MockResponse()
-
-        import httpx
-        monkeypatch.setattr(httpx, "Client", MockClient)
-
-        provider = OllamaProvider()
-        provider.complete("Prompt")
-
-        assert "options" not in captured_payload
+    @pytest.mark.parametrize(
+        "kwargs, expected_options",
+        [
+            ({"temperature": 0.5, "max_tokens": 100}, {"temperature": 0.5, "num_predict": 100}),
+            ({"max_tokens": 256}, {"num_predict": 256}),
+            ({"unknown_param": "should be ignored"}, None),
+            ({}, None),
+        ],
+        ids=["recognized_kwargs", "max_tokens_to_num_predict", "unknown_kwargs", "no_kwargs"],
+    )
+    def test_complete_maps_kwargs_to_options(
+        self, mock_httpx, ollama_provider, kwargs, expected_options
+    ) -> None:
+        """Verify complete() maps per-call kwargs onto Ollama's options."""
+        captured = {}
+        mock_httpx(json_data=OLLAMA_OK, capture=captured)
+
+        ollama_provider.complete("Prompt", **kwargs)
+
+        # None means the request must carry no options key at all
+        assert captured["payload"].get("options") == expected_options
 
 
 # =============================================================================
@@ -441,31 +323,30 @@ class TestOllamaProviderKwargs:
 
 
 @pytest.mark.integration
+@pytest.mark.xdist_group("ollama")
 class TestOllamaProviderIntegration:
     """Integration tests requiring a running Ollama server."""
 
-    def test_is_available(self) -> None:
+    def test_is_available(self, ollama_available) -> None:
         """Test checking if Ollama is available."""
-        provider = OllamaProvider()
         # This might be True or False depending on whether Ollama is running
-        result = provider.is_available()
-        assert isinstance(result, bool)
+        assert isinstance(ollama_available, bool)
 
-    def test_list_models(self) -> None:
+    def test_list_models(self, shared_httpx_client, ollama_available) -> None:
         """Test listing available models."""
-        provider = OllamaProvider()
-        if not provider.is_available():
+        if not ollama_available:
             pytest.skip("Ollama not available")
 
+        provider = OllamaProvider(client=shared_httpx_client)
         models = provider.list_models()
         assert isinstance(models, list)
 
-    def test_complete_real(self) -> None:
+    def test_complete_real(self, shared_httpx_client, ollama_available) -> None:
         """Test real completion (requires Ollama running)."""
-        provider = OllamaProvider()
-        if not provider.is_available():
+        if not ollama_available:
             pytest.skip("Ollama not available")
 
+        provider = OllamaProvider(client=shared_httpx_client)
         response = provider.complete("What is 2+2? Reply with just the number.")
 
         assert isinstance(response.text, str)
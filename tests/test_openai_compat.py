@@ -5,7 +5,6 @@ This module tests:
 - OpenAICompatProvider configuration
 - Successful response parsing (chat/completions and completions formats)
 - Error handling (connection, timeout, HTTP errors)
-- Protocol and base class compliance
 
 Integration tests that require a running API server are marked
 with @pytest.mark.integration and skipped by default.
@@ -13,70 +12,119 @@ with @pytest.mark.integration and skipped by default.
 
 import os
 
+import httpx
 import pytest
 
-from kaizen.llm import (
-    LLMProvider,
-    LLMProviderProtocol,
-    LLMError,
-    OpenAICompatProvider,
-)
+from kaizen.llm import LLMError, OpenAICompatProvider
 
 
 # =============================================================================
-# CONFIGURATION TESTS
+# CANNED RESPONSES
 # =============================================================================
 
+# Response bodies returned by the mocked server. Treated as read-only by tests.
+CHAT_OK = {"choices": [{"message": {"content": "OK"}}], "model": "test"}
+CHAT_OK_WITH_USAGE = {
+    "choices": [
+        {
+            "message": {"role": "assistant", "content": "Hello, world!"},
+            "finish_reason": "stop",
+        }
+    ],
+    "model": "test-model",
+    "usage": {
+        "prompt_tokens": 10,
+        "completion_tokens": 5,
+    },
+}
+COMPLETIONS_OK = {
+    "choices": [{"text": "Fallback response"}],
+    "model": "test-model",
+}
 
-class TestOpenAICompatProviderConfig:
-    """Tests for OpenAICompatProvider configuration."""
 
-    def test_default_config(self) -> None:
-        """Verify default configuration."""
-        provider = OpenAICompatProvider(base_url="http://localhost:8000")
+# =============================================================================
+# FIXTURES
+# =============================================================================
 
-        assert provider.model_name == "default"
-        assert provider.base_url == "http://localhost:8000"
 
-    def test_custom_config(self) -> None:
-        """Verify custom configuration."""
-        provider = OpenAICompatProvider(
-            base_url="https://my-server.modal.run",
-            model="Qwen/Qwen2.5-72B-Instruct",
-            api_key="sk-test-123",
-            timeout=300.0,
-            endpoint="/v1/completions",
-        )
+@pytest.fixture(scope="module")
+def openai_compat_provider() -> OpenAICompatProvider:
+    """
+    Default-config OpenAICompatProvider shared by the tests in this module.
 
-        assert provider.model_name == "Qwen/Qwen2.5-72B-Instruct"
-        assert provider.base_url == "https://my-server.modal.run"
+    Providers hold no per-request state, so tests that only need the
+    defaults can share one instance. Tests that need custom config
+    construct their own.
+    """
+    return OpenAICompatProvider(base_url="http://localhost:8000")
 
-    def test_base_url_strips_trailing_slash(self) -> None:
-        """Verify trailing slash is stripped from base URL."""
-        provider = OpenAICompatProvider(base_url="http://localhost:8000/")
 
-        assert provider.base_url == "http://localhost:8000"
+@pytest.fixture(scope="session")
+def kaizen_model_url() -> str:
+    """
+    URL of a real OpenAI-compatible server, from KAIZEN_MODEL_URL.
 
-    def test_repr(self) -> None:
-        """Verify __repr__ returns useful string."""
-        provider = OpenAICompatProvider(
-            base_url="http://localhost:8000",
-            model="test-model",
-        )
+    Read once per session. Tests that request it are skipped when the
+    variable is not set; pytest caches the skip for the session.
+    """
+    url = os.environ.get("KAIZEN_MODEL_URL")
+    if not url:
+        pytest.skip("KAIZEN_MODEL_URL not set")
+    return url
+
+
+# =============================================================================
+# CONFIGURATION TESTS
+# =============================================================================
+
+
+def test_openai_compat_default_config(openai_compat_provider) -> None:
+    """Verify default OpenAICompatProvider configuration."""
+    assert openai_compat_provider.model_name == "default"
+    assert openai_compat_provider.base_url == "http://localhost:8000"
+
+
+@pytest.mark.parametrize(
+    "kwargs, attr, expected",
+    [
+        (
+            {
+                "base_url": "https://my-server.modal.run",
+                "model": "Qwen/Qwen2.5-72B-Instruct",
+                "api_key": "sk-test-123",
+                "timeout": 300.0,
+                "endpoint": "/v1/completions",
+            },
+            "model_name",
+            "Qwen/Qwen2.5-72B-Instruct",
+        ),
+        (
+            {"base_url": "https://my-server.modal.run", "model": "m"},
+            "base_url",
+            "https://my-server.modal.run",
+        ),
+        ({"base_url": "http://localhost:8000/"}, "base_url", "http://localhost:8000"),
+    ],
+    ids=["custom_model", "custom_base_url", "strips_trailing_slash"],
+)
+def test_openai_compat_config(kwargs, attr, expected) -> None:
+    """Verify OpenAICompatProvider applies custom configuration."""
+    provider = OpenAICompatProvider(**kwargs)
 
-        repr_str = repr(provider)
-        assert "OpenAICompatProvider" in repr_str
-        assert "test-model" in repr_str
+    assert getattr(provider, attr) == expected
 
-    def test_implements_protocol(self) -> None:
-        """Verify OpenAICompatProvider implements LLMProviderProtocol."""
-        provider = OpenAICompatProvider(base_url="http://localhost:8000")
-        assert isinstance(provider, LLMProviderProtocol)
 
-    def test_is_llm_provider(self) -> None:
-        """Verify OpenAICompatProvider is an LLMProvider."""
-        provider = OpenAICompatProvider(base_url="http://localhost:8000")
-        assert isinstance(provider, LLMProvider)
+def test_openai_compat_repr() -> None:
+    """Verify __repr__ returns useful string."""
+    provider = OpenAICompatProvider(
+        base_url="http://localhost:8000",
+        model="test-model",
+    )
+
+    repr_str = repr(provider)
+    assert "OpenAICompatProvider" in repr_str
+    assert "test-model" in repr_str
 
 
 # =============================================================================
@@ -87,44 +135,10 @@ class TestOpenAICompatProviderConfig:
 class TestOpenAICompatProviderMocked:
     """Tests for OpenAICompatProvider with mocked HTTP."""
 
-    def test_complete_chat_completions(self, monkeypatch) -> None:
+    def test_complete_chat_completions(self, mock_httpx) -> None:
         """Verify complete() parses chat/completions response format."""
         captured = {}
-
-        class MockResponse:
-            status_code = 200
-            def raise_for_status(self):
-                pass
-            def json(self):
-                return {
-                    "choices": [
-                        {
-                            "message": {"role": "assistant", "content": "Hello, world!"},
-                            "finish_reason": "stop",
-                        }
-                    ],
-                    "model": "test-model",
-                    "usage": {
-                        "prompt_tokens": 10,
-                        "completion_tokens": 5,
-                    },
-                }
-
-        class MockClient:
-            def __init__(self, **kwargs):
-                pass
-            def __enter__(self):
-                return self
-            def __exit__(self, *args):
-                pass
-            def post(self, url, json, headers=None):
-                captured["url"] = url
-                captured["payload"] = json
-                captured["headers"] = headers
-                return MockResponse()
-
-        import httpx
-        monkeypatch.setattr(httpx, "Client", MockClient)
+        mock_httpx(json_data=CHAT_OK_WITH_USAGE, capture=captured)
 
         provider = OpenAICompatProvider(
             base_url="http://localhost:8000",
@@ -143,95 +157,29 @@ class TestOpenAICompatProviderMocked:
         assert messages[0] == {"role": "system", "content": "Be helpful"}
         assert messages[1] == {"role": "user", "content": "Test prompt"}
 
-    def test_complete_without_system(self, monkeypatch) -> None:
+    def test_complete_without_system(self, mock_httpx, openai_compat_provider) -> None:
         """Verify complete() works without system message."""
         captured = {}
+        mock_httpx(json_data=CHAT_OK, capture=captured)
 
-        class MockResponse:
-            status_code = 200
-            def raise_for_status(self):
-                pass
-            def json(self):
-                return {
-                    "choices": [{"message": {"content": "OK"}}],
-                    "model": "test",
-                }
-
-        class MockClient:
-            def __init__(self, **kwargs):
-                pass
-            def __enter__(self):
-                return self
-            def __exit__(self, *args):
-                pass
-            def post(self, url, json, headers=None):
-                captured["payload"] = json
-                return MockResponse()
-
-        import httpx
-        monkeypatch.setattr(httpx, "Client", MockClient)
-
-        provider = OpenAICompatProvider(base_url="http://localhost:8000")
-        provider.complete("Test prompt")
+        openai_compat_provider.complete("Test prompt")
 
         messages = captured["payload"]["messages"]
         assert len(messages) == 1
         assert messages[0] == {"role": "user", "content": "Test prompt"}
 
-    def test_complete_completions_fallback(self, monkeypatch) -> None:
+    def test_complete_completions_fallback(self, mock_httpx, openai_compat_provider) -> None:
         """Verify complete() falls back to completions response format."""
-        class MockResponse:
-            status_code = 200
-            def raise_for_status(self):
-                pass
-            def json(self):
-                return {
-                    "choices": [{"text": "Fallback response"}],
-                    "model": "test-model",
-                }
-
-        class MockClient:
-            def __init__(self, **kwargs):
-                pass
-            def __enter__(self):
-                return self
-            def __exit__(self, *args):
-                pass
-            def post(self, url, json, headers=None):
-                return MockResponse()
-
-        import httpx
-        monkeypatch.setattr(httpx, "Client", MockClient)
-
-        provider = OpenAICompatProvider(base_url="http://localhost:8000")
-        response = provider.complete("Test")
+        mock_httpx(json_data=COMPLETIONS_OK)
+
+        response = openai_compat_provider.complete("Test")
 
         assert response.text == "Fallback response"
 
-    def test_complete_with_api_key(self, monkeypatch) -> None:
+    def test_complete_with_api_key(self, mock_httpx) -> None:
         """Verify complete() includes API key in Authorization header."""
         captured = {}
-
-        class MockResponse:
-            status_code = 200
-            def raise_for_status(self):
-                pass
-            def json(self):
-                return {"choices": [{"message": {"content": "OK"}}], "model": "test"}
-
-        class MockClient:
-            def __init__(self, **kwargs):
-                pass
-            def __enter__(self):
-                return self
-            def __exit__(self, *args):
-                pass
-            def post(self, url, json, headers=None):
-                captured["headers"] = headers
-                return MockResponse()
-
-        import httpx
-        monkeypatch.setattr(httpx, "Client", MockClient)
+        mock_httpx(json_data=CHAT_OK, capture=captured)
 
         provider = OpenAICompatProvider(
             base_url="http://localhost:8000",
@@ -241,109 +189,31 @@ class TestOpenAICompatProviderMocked:
 
         assert captured["headers"]["Authorization"] == "Bearer sk-test-key"
 
-    def test_complete_connection_error(self, monkeypatch) -> None:
-        """Verify complete() handles connection errors."""
-        import httpx
-
-        class MockClient:
-            def __init__(self, **kwargs):
-                pass
-            def __enter__(self):
-                return self
-            def __exit__(self, *args):
-                pass
-            def post(self, url, json, headers=None):
-                raise httpx.ConnectError("Connection refused")
-
-        monkeypatch.setattr(httpx, "Client", MockClient)
-
-        provider = OpenAICompatProvider(base_url="http://localhost:8000")
+    @pytest.mark.parametrize(
+        "mock_kwargs, expected_substr",
+        [
+            ({"exc": httpx.ConnectError("Connection refused")}, "Cannot connect"),
+            ({"exc": httpx.TimeoutException("Timeout")}, "timed out"),
+            ({"status": 500}, "500"),
+        ],
+        ids=["connection_error", "timeout", "http_error"],
+    )
+    def test_complete_error(
+        self, mock_httpx, openai_compat_provider, mock_kwargs, expected_substr
+    ) -> None:
+        """Verify complete() maps transport and HTTP failures to LLMError."""
+        mock_httpx(**mock_kwargs)
 
         with pytest.raises(LLMError) as exc_info:
-            provider.complete("Test")
+            openai_compat_provider.complete("Test")
 
-        assert "Cannot connect" in exc_info.value.message
+        assert expected_substr in exc_info.value.message
         assert exc_info.value.provider == "openai_compat"
 
-    def test_complete_timeout(self, monkeypatch) -> None:
-        """Verify complete() handles timeouts."""
-        import httpx
-
-        class MockClient:
-            def __init__(self, **kwargs):
-                pass
-            def __enter__(self):
-                return self
-            def __exit__(self, *args):
-                pass
-            def post(self, url, json, headers=None):
-                raise httpx.TimeoutException("Timeout")
-
-        monkeypatch.setattr(httpx, "Client", MockClient)
-
-        provider = OpenAICompatProvider(base_url="http://localhost:8000")
-
-        with pytest.raises(LLMError) as exc_info:
-            provider.complete("Test")
-
-        assert "timed out" in exc_info.value.message
-
-    def test_complete_http_error(self, monkeypatch) -> None:
-        """Verify complete() handles HTTP errors."""
-        import httpx
-
-        class MockResponse:
-            status_code = 500
-            def raise_for_status(self):
-                raise httpx.HTTPStatusError(
-                    "Server error",
-                    request=None,
-                    response=self,
-                )
-
-        class MockClient:
-            def __init__(self, **kwargs):
-                pass
-            def __enter__(self):
-                return self
-            def __exit__(self, *args):
-                pass
-            def post(self, url, json, headers=None):
-                return MockResponse()
-
-        monkeypatch.setattr(httpx, "Client", MockClient)
-
-        provider = OpenAICompatProvider(base_url="http://localhost:8000")
-
-        with pytest.raises(LLMError) as exc_info:
-            provider.complete("Test")
-
-        assert "500" in exc_info.value.message
-
-    def test_complete_custom_endpoint(self, monkeypatch) -> None:
+    def test_complete_custom_endpoint(self, mock_httpx) -> None:
         """Verify complete() uses custom endpoint path."""
         captured = {}
-
-        class MockResponse:
-            status_code = 200
-            def raise_for_status(self):
-                pass
-            def json(self):
-                return {"choices": [{"message": {"content": "OK"}}], "model": "test"}
-
-        class MockClient:
-            def __init__(self, **kwargs):
-                pass
-            def __enter__(self):
-                return self
-            def __exit__(self, *args):
-                pass
-            def post(self, url, json, headers=None):
-                captured["url"] = url
-                return MockResponse()
-
-        import httpx
-        monkeypatch.setattr(httpx, "Client", MockClient)
+        mock_httpx(json_data=CHAT_OK, capture=captured)
 
         provider = OpenAICompatProvider(
             base_url="http://localhost:8000",
@@ -353,6 +223,24 @@ class TestOpenAICompatProviderMocked:
 
         assert captured["url"] == "http://localhost:8000/v1/completions"
 
+    def test_complete_with_shared_client(self) -> None:
+        """Verify complete() sends through a caller-supplied client."""
+        requests = []
+
+        def handler(request: httpx.Request) -> httpx.Response:
+            requests.append(request)
+            return httpx.Response(200, json=CHAT_OK)
+
+        with httpx.Client(transport=httpx.MockTransport(handler)) as client:
+            provider = OpenAICompatProvider(base_url="http://localhost:8000", client=client)
+            response = provider.complete("Test")
+
+            # The provider must leave the caller's client open
+            assert not client.is_closed
+
+        assert response.text == "OK"
+        assert requests[0].url == "http://localhost:8000/v1/chat/completions"
+
 
 # =============================================================================
 # KWARGS OVERRIDE TESTS
@@ -362,26 +250,10 @@ class TestOpenAICompatProviderMocked:
 class TestOpenAICompatProviderKwargs:
     """Tests for per-call kwargs in OpenAICompatProvider."""
 
-    def test_complete_kwargs_override_constructor_max_tokens(self, monkeypatch) -> None:
+    def test_complete_kwargs_override_constructor_max_tokens(self, mock_httpx) -> None:
         """Verify per-call max_tokens overrides constructor default."""
         captured = {}
-
-        class MockResponse:
-            status_code = 200
-            def raise_for_status(self): pass
-            def json(self):
-                return {"choices": [{"message": {"content": "OK"}}], "model": "test"}
-
-        class MockClient:
-            def __init__(self, **kwargs): pass
-            def __enter__(self): return self
-            def __exit__(self, *args): pass
-            def post(self, url, json, headers=None):
-                captured["payload"] = json
-                return MockResponse()
-
-        import httpx
-        monkeypatch.setattr(httpx, "Client", MockClient)
+        mock_httpx(json_data=CHAT_OK, capture=captured)
 
         provider = OpenAICompatProvider(
             base_url="http://localhost:8000",
@@ -392,52 +264,21 @@ class TestOpenAICompatProviderKwargs:
         assert captured["payload"]["max_tokens"] == 2000
         assert captured["payload"]["temperature"] == 0.7
 
-    def test_complete_kwargs_without_constructor_max_tokens(self, monkeypatch) -> None:
+    def test_complete_kwargs_without_constructor_max_tokens(
+        self, mock_httpx, openai_compat_provider
+    ) -> None:
         """Verify per-call max_tokens works when constructor has no default."""
         captured = {}
+        mock_httpx(json_data=CHAT_OK, capture=captured)
 
-        class MockResponse:
-            status_code = 200
-            def raise_for_status(self): pass
-            def json(self):
-                return {"choices": [{"message": {"content": "OK"}}], "model": "test"}
-
-        class MockClient:
-            def __init__(self, **kwargs): pass
-            def __enter__(self): return self
-            def __exit__(self, *args): pass
-            def post(self, url, json, headers=None):
-                captured["payload"] = json
-                return MockResponse()
-
-        import httpx
-        monkeypatch.setattr(httpx, "Client", MockClient)
-
-        provider = OpenAICompatProvider(base_url="http://localhost:8000")
-        provider.complete("Test", max_tokens=500)
+        openai_compat_provider.complete("Test", max_tokens=500)
 
         assert captured["payload"]["max_tokens"] == 500
 
-    def test_complete_constructor_max_tokens_used_when_no_kwargs(self, monkeypatch) -> None:
+    def test_complete_constructor_max_tokens_used_when_no_kwargs(self, mock_httpx) -> None:
         """Verify constructor max_tokens used when no per-call override."""
         captured = {}
-
-        class MockResponse:
-            status_code = 200
-            def raise_for_status(self): pass
-            def json(self):
-                return {"choices": [{"message": {"content": "OK"}}], "model": "test"}
-
-        class MockClient:
-            def __init__(self, **kwargs): pass
-            def __enter__(self): return self
-            def __exit__(self, *args): pass
-            def post(self, url, json, headers=None):
-                captured["payload"] = json
-                return MockResponse()
-
-        import httpx
-        monkeypatch.setattr(httpx, "Client", MockClient)
+        mock_httpx(json_data=CHAT_OK, capture=captured)
 
         provider = OpenAICompatProvider(
             base_url="http://localhost:8000",
@@ -447,29 +288,12 @@ class TestOpenAICompatProviderKwargs:
 
         assert captured["payload"]["max_tokens"] == 4096
 
-    def test_complete_ignores_unknown_kwargs(self, monkeypatch) -> None:
+    def test_complete_ignores_unknown_kwargs(self, mock_httpx, openai_compat_provider) -> None:
         """Verify unrecognized kwargs are silently ignored."""
         captured = {}
+        mock_httpx(json_data=CHAT_OK, capture=captured)
 
-        class MockResponse:
-            status_code = 200
-            def raise_for_status(self): pass
-            def json(self):
-                return {"choices": [{"message": {"content": "OK"}}], "model": "test"}
-
-        class MockClient:
-            def __init__(self, **kwargs): pass
-            def __enter__(self): return self
-            def __exit__(self, *args): pass
-            def post(self, url, json, headers=None):
-                captured["payload"] = json
-                return MockResponse()
-
-        import httpx
-        monkeypatch.setattr(httpx, "Client", MockClient)
-
-        provider = OpenAICompatProvider(base_url="http://localhost:8000")
-        provider.complete("Test", fake_param="ignored")
+        openai_compat_provider.complete("Test", fake_param="ignored")
 
         assert "fake_param" not in captured["payload"]
 
@@ -480,21 +304,17 @@ class TestOpenAICompatProviderKwargs:
 
 
 @pytest.mark.integration
+@pytest.mark.xdist_group("openai_compat")
 class TestOpenAICompatProviderIntegration:
     """Integration tests requiring a running OpenAI-compatible API server."""
 
-    @pytest.fixture(autouse=True)
-    def _require_model_url(self) -> None:
-        """Skip if KAIZEN_MODEL_URL is not set."""
-        if not os.environ.get("KAIZEN_MODEL_URL"):
-            pytest.skip("KAIZEN_MODEL_URL not set")
-
-    def test_complete_real(self) -> None:
+    def test_complete_real(self, kaizen_model_url, shared_httpx_client) -> None:
         """Test real completion against a running endpoint."""
         provider = OpenAICompatProvider(
-            base_url=os.environ["KAIZEN_MODEL_URL"],
+            base_url=kaizen_model_url,
             model=os.environ.get("KAIZEN_MODEL_NAME", "default"),
             api_key=os.environ.get("KAIZEN_API_KEY"),
+            client=shared_httpx_client,
         )
 
         response = provider.complete("What is 2+2? Reply with just the number.")
@@ -14,6 +14,8 @@ This means state, trajectory, and artifacts should all survive
 the roundtrip without any data loss or corruption.
 """
 
+import os
+import sqlite3
 from pathlib import Path
 
 import pytest
@@ -54,6 +56,67 @@ class TestSaveBasics:
         loaded = Session.load(temp_session_path)
         assert loaded.get("version") == 2
 
+    def test_save_leaves_no_temp_file(self, temp_dir: Path) -> None:
+        """Verify save() renames its temporary file into place."""
+        session = Session()
+        session.save(temp_dir / "session.kaizen")
+
+        assert [p.name for p in temp_dir.iterdir()] == ["session.kaizen"]
+
+    def test_failed_save_keeps_existing_file(self, temp_session_path: Path) -> None:
+        """Verify a save that fails midway leaves the previous file intact."""
+
+        class FailingSession(Session):
+            def _save_artifacts(self, conn: object) -> None:
+                raise RuntimeError("disk full")
+
+        session = Session()
+        session.set("version", 1)
+        session.save(temp_session_path)
+
+        failing = FailingSession()
+        failing.set("version", 2)
+        with pytest.raises(RuntimeError, match="disk full"):
+            failing.save(temp_session_path)
+
+        assert Session.load(temp_session_path).get("version") == 1
+        assert list(temp_session_path.parent.iterdir()) == [temp_session_path]
+
+    def test_save_leaves_other_temp_files_alone(self, temp_dir: Path) -> None:
+        """Verify save() does not delete a file that merely has its temp name."""
+        path = temp_dir / "session.kaizen"
+        other = temp_dir / "session.kaizen.tmp"
+        other.write_bytes(b"not ours")
+
+        Session().save(path)
+
+        assert other.read_bytes() == b"not ours"
+
+    @pytest.mark.skipif(os.name != "posix", reason="POSIX permission bits")
+    def test_save_keeps_file_mode(self, temp_session_path: Path) -> None:
+        """Verify saving over an existing file keeps its permission bits."""
+        Session().save(temp_session_path)
+        temp_session_path.chmod(0o640)
+
+        Session().save(temp_session_path)
+
+        assert temp_session_path.stat().st_mode & 0o777 == 0o640
+
+    @pytest.mark.skipif(os.name != "posix", reason="POSIX symlinks")
+    def test_save_through_symlink_replaces_target(self, temp_dir: Path) -> None:
+        """Verify saving to a symlink updates the file it points to."""
+        target = temp_dir / "real.kaizen"
+        link = temp_dir / "link.kaizen"
+        Session().save(target)
+        link.symlink_to(target)
+
+        session = Session()
+        session.set("version", 2)
+        session.save(link)
+
+        assert link.is_symlink()
+        assert Session.load(target).get("version") == 2
+
 
 class TestLoadBasics:
     """Tests for basic load functionality."""
@@ -79,6 +142,46 @@ class TestLoadBasics:
         with pytest.raises(FileNotFoundError, match="not found"):
             Session.load(temp_session_path)
 
+    def test_repeated_loads_are_independent(self, temp_session_path: Path) -> None:
+        """Verify changes to one loaded session do not show up in the next load."""
+        session = Session()
+        session.set("items", [1, 2])
+        session.append("agent1", EntryType.AGENT_COMPLETED, {"out": {"n": 1}})
+        session.write_artifact("a.txt", b"data")
+        session.save(temp_session_path)
+
+        first = Session.load(temp_session_path)
+        loaded_length = first.get_trajectory_length()
+        first.get("items").append(3)
+        first.get_trajectory(entry_type=EntryType.AGENT_COMPLETED)[0].content["out"]["n"] = 99
+        first.write_artifact("a.txt", b"changed")
+        first.write_artifact("b.txt", b"new")
+
+        second = Session.load(temp_session_path)
+        assert second.get("items") == [1, 2]
+        completed = second.get_trajectory(entry_type=EntryType.AGENT_COMPLETED)
+        assert completed[0].content == {"out": {"n": 1}}
+        assert second.list_artifacts() == ["a.txt"]
+        assert second.read_artifact("a.txt") == b"data"
+        assert second.get_trajectory_length() == loaded_length
+
+    def test_subclass_load_runs_subclass_init(self, temp_session_path: Path) -> None:
+        """Verify loading a Session subclass keeps attributes set in its __init__."""
+
+        class TaggedSession(Session):
+            def __init__(self, **kwargs: object) -> None:
+                super().__init__(**kwargs)
+                self.extra = "tag"
+
+        session = TaggedSession()
+        session.set("key", "value")
+        session.save(temp_session_path)
+
+        loaded = TaggedSession.load(temp_session_path)
+        assert type(loaded) is TaggedSession
+        assert loaded.extra == "tag"
+        assert loaded.get("key") == "value"
+
 
 class TestRoundtripSessionId:
     """Tests for session ID preservation."""
@@ -171,13 +274,28 @@ class TestRoundtripTrajectory:
         user_entries = [e for e in trajectory if e.agent_id != "system"]
         assert len(user_entries) == 3
 
+    def test_entry_type_filter_after_load(self, temp_session_path: Path) -> None:
+        """Verify entry_type filtering works on a loaded session."""
+        session = Session()
+        session.append("agent1", EntryType.AGENT_INVOKED, {"step": 1})
+        session.append("agent1", EntryType.AGENT_COMPLETED, {"step": 2})
+        session.save(temp_session_path)
+
+        loaded = Session.load(temp_session_path)
+        loaded.append("agent1", EntryType.AGENT_COMPLETED, {"step": 3})
+
+        completed = loaded.get_trajectory(entry_type=EntryType.AGENT_COMPLETED)
+        assert [e.content["step"] for e in completed] == [2, 3]
+        assert len(loaded.get_trajectory(entry_type=EntryType.SESSION_SAVED)) == 1
+
     def test_trajectory_sequence_numbers_preserved(
         self, temp_session_path: Path
     ) -> None:
         """Verify trajectory sequence numbers survive roundtrip."""
         session = Session()
-        for i in range(5):
-            session.append("agent", EntryType.AGENT_COMPLETED, {"n": i})
+        session.append_many(
+            ("agent", EntryType.AGENT_COMPLETED, {"n": i}) for i in range(5)
+        )
         session.save(temp_session_path)
 
         loaded = Session.load(temp_session_path)
@@ -209,6 +327,58 @@ class TestRoundtripTrajectory:
         delta = abs((loaded_timestamp - original_timestamp).total_seconds())
         assert delta < 0.001
 
+    def test_trajectory_timestamps_stored_as_microseconds(
+        self, temp_session_path: Path
+    ) -> None:
+        """Verify timestamps are stored as integers and restored exactly."""
+        session = Session()
+        session.save(temp_session_path)
+
+        conn = sqlite3.connect(temp_session_path)
+        try:
+            stored = conn.execute("SELECT timestamp FROM trajectory").fetchall()
+        finally:
+            conn.close()
+        assert all(isinstance(row[0], int) for row in stored)
+
+        loaded = Session.load(temp_session_path)
+        assert [e.timestamp for e in loaded.get_trajectory()[:-1]] == [
+            e.timestamp for e in session.get_trajectory()
+        ]
+
+    def test_version_1_text_timestamps_still_load(self, temp_session_path: Path) -> None:
+        """Verify files written with ISO-8601 text timestamps can be loaded."""
+        session = Session()
+        session.append("agent", EntryType.AGENT_COMPLETED, {"n": 1})
+        session.save(temp_session_path)
+        original = {e.seq_num: e.timestamp for e in session.get_trajectory()}
+
+        # Rewrite the file in the version 1 layout
+        conn = sqlite3.connect(temp_session_path)
+        with conn:
+            conn.execute("UPDATE metadata SET value = '1' WHERE key = 'schema_version'")
+            for seq_num, timestamp in original.items():
+                conn.execute(
+                    "UPDATE trajectory SET timestamp = ? WHERE seq_num = ?",
+                    (timestamp.isoformat(), seq_num),
+                )
+        conn.close()
+
+        loaded = Session.load(temp_session_path)
+        assert {e.seq_num: e.timestamp for e in loaded.get_trajectory()[:-1]} == original
+
+    def test_unknown_schema_version_rejected(self, temp_session_path: Path) -> None:
+        """Verify load() refuses files written by a newer schema version."""
+        Session().save(temp_session_path)
+
+        conn = sqlite3.connect(temp_session_path)
+        with conn:
+            conn.execute("UPDATE metadata SET value = '99' WHERE key = 'schema_version'")
+        conn.close()
+
+        with pytest.raises(ValueError, match="Schema version mismatch"):
+            Session.load(temp_session_path)
+
     def test_trajectory_content_preserved(self, temp_session_path: Path) -> None:
         """Verify trajectory entry content survives roundtrip."""
         session = Session()
@@ -222,10 +392,7 @@ class TestRoundtripTrajectory:
 
         loaded = Session.load(temp_session_path)
         # Find the agent entry (not system)
-        user_entries = [
-            e for e in loaded.get_trajectory()
-            if e.agent_id == "agent"
-        ]
+        user_entries = loaded.get_trajectory(agent_id="agent")
         assert len(user_entries) == 1
         assert user_entries[0].content == complex_content
 
@@ -238,10 +405,7 @@ class TestRoundtripTrajectory:
         session.save(temp_session_path)
 
         loaded = Session.load(temp_session_path)
-        user_entries = [
-            e for e in loaded.get_trajectory()
-            if e.agent_id == "agent"
-        ]
+        user_entries = loaded.get_trajectory(agent_id="agent")
 
         assert user_entries[0].entry_type == EntryType.AGENT_INVOKED
         assert user_entries[1].entry_type == EntryType.AGENT_COMPLETED
@@ -337,6 +501,19 @@ class TestLifecycleTrajectoryEntries:
         assert len(saved_entries) == 1
         assert str(temp_session_path) in saved_entries[0].content["path"]
 
+    def test_saved_file_ends_with_session_saved(self, temp_session_path: Path) -> None:
+        """Verify the SESSION_SAVED entry is written in the same save, not after it."""
+        session = Session()
+        session.append("test", EntryType.AGENT_INVOKED, {"x": 1})
+        session.save(temp_session_path)
+
+        loaded = Session.load(temp_session_path)
+        entry_types = [e.entry_type for e in loaded.get_trajectory()]
+
+        # The saved file ends with SESSION_SAVED; load() appends SESSION_LOADED
+        assert entry_types[-2:] == [EntryType.SESSION_SAVED, EntryType.SESSION_LOADED]
+        assert len(entry_types) == session.get_trajectory_length() + 1
+
     def test_load_creates_trajectory_entry(self, temp_session_path: Path) -> None:
         """Verify load() adds a SESSION_LOADED entry."""
         session = Session()
@@ -479,10 +656,7 @@ class TestFullWorkflowRoundtrip:
         assert loaded.get("results") == [1, 2, 3]
 
         # Verify trajectory (find user entries)
-        user_entries = [
-            e for e in loaded.get_trajectory()
-            if e.agent_id == "agent1"
-        ]
+        user_entries = loaded.get_trajectory(agent_id="agent1")
         assert len(user_entries) == 3
         assert user_entries[0].entry_type == EntryType.AGENT_INVOKED
         assert user_entries[2].content["output"] == "HELLO WORLD"
@@ -8,6 +8,8 @@ Tests use a mock LLM provider to avoid requiring a running Ollama server.
 Integration tests with real LLM are marked with @pytest.mark.integration.
 """
 
+import sys
+
 import pytest
 
 from kaizen.planner import Planner, PlanResult
@@ -37,8 +39,8 @@ class MockLLMProvider(LLMProvider):
             response: The text to return from complete().
             model: Model name to report.
         """
-        self._response = response
         self._model = model
+        self.set_response(response)
         self.last_prompt: str | None = None
         self.last_system: str | None = None
         self.call_count = 0
@@ -46,13 +48,15 @@ class MockLLMProvider(LLMProvider):
     def set_response(self, response: str) -> None:
         """Set the response to return."""
         self._response = response
+        # Built once here rather than on every complete() call
+        self._cached_response = LLMResponse(text=response, model=self._model)
 
     def complete(self, prompt: str, system: str | None = None, **kwargs) -> LLMResponse:
         """Return the configured response."""
         self.last_prompt = prompt
         self.last_system = system
         self.call_count += 1
-        return LLMResponse(text=self._response, model=self._model)
+        return self._cached_response
 
     @property
     def model_name(self) -> str:
@@ -186,6 +190,25 @@ class TestPlannerConfig:
 
         assert "modified" not in planner.capabilities
 
+    def test_set_capabilities_drops_duplicates(self) -> None:
+        """Verify set_capabilities keeps the first occurrence of each name."""
+        provider = MockLLMProvider()
+        planner = Planner(provider)
+
+        planner.set_capabilities(["b", "a", "b", "c", "a"])
+
+        assert planner.capabilities == ["b", "a", "c"]
+
+    def test_capability_names_are_interned(self) -> None:
+        """Verify capability names are stored as interned strings."""
+        provider = MockLLMProvider()
+        name = "".join(["rev", "erse"])  # Built at runtime, not interned
+        planner = Planner(provider, capabilities=[name])
+        planner.add_capability("".join(["upper", "case"]))
+
+        assert planner.capabilities[0] is sys.intern("reverse")
+        assert planner.capabilities[1] is sys.intern("uppercase")
+
     def test_repr(self) -> None:
         """Verify __repr__ returns useful string."""
         provider = MockLLMProvider()
@@ -232,7 +255,26 @@ class TestPlannerPlan:
         planner.plan("test")
 
         assert "reverse" in provider.last_system
-        assert "uppercase" in provider.last_system
+        assert "- uppercase" in provider.last_system
+
+    def test_plan_system_prompt_tracks_capability_changes(self) -> None:
+        """Verify the system prompt reflects capabilities added between plans."""
+        provider = MockLLMProvider(response="[]")
+        planner = Planner(provider, capabilities=["reverse"])
+
+        planner.plan("first")
+        first_system = provider.last_system
+        planner.plan("second")
+        assert provider.last_system is first_system  # Reused, not rebuilt
+
+        planner.add_capability("uppercase")
+        planner.plan("third")
+        assert "- uppercase" in provider.last_system
+
+        planner.set_capabilities(["lowercase"])
+        planner.plan("fourth")
+        assert "- lowercase" in provider.last_system
+        assert "- reverse" not in provider.last_system
 
     def test_plan_parses_valid_json(self) -> None:
         """Verify plan parses valid JSON response."""
@@ -286,6 +328,31 @@ class TestPlannerPlan:
         assert result.success is True
         assert len(result.calls) == 1
 
+    def test_plan_ignores_brackets_after_the_array(self) -> None:
+        """Verify only the first complete array is parsed, not up to the last ']'."""
+        response = (
+            '[{"capability": "test", "params": {"key": "a]b[c"}}]\n'
+            "Note: see [1] for details."
+        )
+        provider = MockLLMProvider(response=response)
+        planner = Planner(provider, capabilities=["test"])
+
+        result = planner.plan("test")
+
+        assert result.success is True
+        assert result.calls[0].params == {"key": "a]b[c"}
+
+    def test_plan_rejects_unterminated_array(self) -> None:
+        """Verify an array that is never closed is reported as invalid JSON."""
+        response = '[{"capability": "test", "params": {}}'
+        provider = MockLLMProvider(response=response)
+        planner = Planner(provider, capabilities=["test"])
+
+        result = planner.plan("test")
+
+        assert result.success is False
+        assert "Invalid JSON" in result.error["message"]
+
     def test_plan_handles_missing_params(self) -> None:
         """Verify plan handles calls without params field."""
         response = '[{"capability": "test"}]'
@@ -297,6 +364,17 @@ class TestPlannerPlan:
         assert result.success is True
         assert result.calls[0].params == {}
 
+    def test_plan_treats_null_params_as_empty(self) -> None:
+        """Verify "params": null is read as no parameters."""
+        response = '[{"capability": "test", "params": null}]'
+        provider = MockLLMProvider(response=response)
+        planner = Planner(provider, capabilities=["test"])
+
+        result = planner.plan("test")
+
+        assert result.success is True
+        assert result.calls[0].params == {}
+
 
 class TestPlannerValidation:
     """Tests for plan validation."""
@@ -335,6 +413,18 @@ class TestPlannerValidation:
         assert result.success is False
         assert "array" in result.error["message"].lower()
 
+    def test_plan_rejects_non_object_params(self) -> None:
+        """Verify plan fails when params is not a JSON object."""
+        response = '[{"capability": "test", "params": ["text"]}]'
+        provider = MockLLMProvider(response=response)
+        planner = Planner(provider, capabilities=["test"])
+
+        result = planner.plan("test")
+
+        assert result.success is False
+        assert result.error["error_code"] == "plan_invalid_format"
+        assert "params" in result.error["message"]
+
     def test_plan_rejects_missing_capability_field(self) -> None:
         """Verify plan fails when capability field is missing."""
         response = '[{"params": {"key": "text"}}]'  # Missing capability
@@ -419,6 +509,7 @@ class TestPlannerTrajectory:
 
 
 @pytest.mark.integration
+@pytest.mark.xdist_group("ollama")
 class TestPlannerIntegration:
     """Integration tests with real LLM."""
 
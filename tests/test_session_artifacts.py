@@ -16,6 +16,10 @@ import pytest
 from kaizen.session import Session, DEFAULT_MAX_ARTIFACT_SIZE
 
 
+# Binary data with null bytes and non-UTF8 sequences (built once per module)
+_BINARY_SAMPLE = bytes(range(256)) * 100
+
+
 class TestArtifactWriteRead:
     """Tests for artifact write and read operations."""
 
@@ -32,13 +36,11 @@ class TestArtifactWriteRead:
     def test_write_artifact_binary_data(self) -> None:
         """Verify binary data (non-text) can be stored."""
         session = Session()
-        # Binary data with null bytes and non-UTF8 sequences
-        data = bytes(range(256)) * 100
 
-        session.write_artifact("binary.bin", data)
+        session.write_artifact("binary.bin", _BINARY_SAMPLE)
         retrieved = session.read_artifact("binary.bin")
 
-        assert retrieved == data
+        assert retrieved == _BINARY_SAMPLE
 
     def test_write_artifact_empty_data(self) -> None:
         """Verify empty bytes can be stored."""
@@ -89,6 +91,19 @@ class TestArtifactWriteRead:
         with pytest.raises(TypeError, match="must be bytes"):
             session.write_artifact("test.txt", [1, 2, 3])  # type: ignore
 
+    def test_write_artifact_bytes_like_data(self) -> None:
+        """Verify bytearray and memoryview data is stored as an independent copy."""
+        session = Session()
+        buffer = bytearray(b"hello")
+
+        session.write_artifact("array.bin", buffer)
+        session.write_artifact("view.bin", memoryview(buffer)[1:4])
+        buffer[0:1] = b"J"
+
+        assert session.read_artifact("array.bin") == b"hello"
+        assert session.read_artifact("view.bin") == b"ell"
+        assert type(session.read_artifact("array.bin")) is bytes
+
 
 class TestArtifactSizeLimits:
     """Tests for artifact size limit enforcement."""
@@ -114,6 +129,18 @@ class TestArtifactSizeLimits:
         with pytest.raises(ValueError, match="exceeds maximum"):
             session.write_artifact("test.bin", data)
 
+    def test_memoryview_limit_counts_bytes(self) -> None:
+        """Verify a memoryview is measured in bytes, not items."""
+        session = Session(max_artifact_size=1000)
+        view = memoryview(bytearray(1004)).cast("I")  # 251 items of 4 bytes
+        length = session.get_trajectory_length()
+
+        with pytest.raises(ValueError, match=r"\(1004 bytes\) exceeds maximum"):
+            session.write_artifact("test.bin", view)
+
+        assert session.list_artifacts() == []
+        assert session.get_trajectory_length() == length
+
     def test_artifact_at_exact_limit_accepted(self) -> None:
         """Verify artifacts at exactly the limit are accepted."""
         session = Session(max_artifact_size=1000)
@@ -178,6 +205,16 @@ class TestArtifactListing:
         # Should still have just one artifact
         assert session.list_artifacts() == ["test.txt"]
 
+    def test_list_artifacts_returns_copy(self) -> None:
+        """Verify modifying the returned list does not affect the session."""
+        session = Session()
+        session.write_artifact("test.txt", b"data")
+
+        names = session.list_artifacts()
+        names.append("other.txt")
+
+        assert session.list_artifacts() == ["test.txt"]
+
 
 class TestArtifactSize:
     """Tests for artifact size retrieval."""
@@ -15,8 +15,11 @@ of a session. These tests verify the core invariants:
 - External mutations don't affect internal state
 """
 
+import uuid
+
 import pytest
 from kaizen.session import Session
+from kaizen.types import EntryType
 
 
 class TestSessionCreation:
@@ -35,6 +38,15 @@ class TestSessionCreation:
         assert len(session.session_id) == 36
         assert session.session_id.count("-") == 4
 
+    def test_generated_id_is_valid_uuid4(self) -> None:
+        """Verify generated IDs parse as version 4 RFC 4122 UUIDs."""
+        session_id = Session().session_id
+        parsed = uuid.UUID(session_id)
+
+        assert parsed.version == 4
+        assert parsed.variant == uuid.RFC_4122
+        assert str(parsed) == session_id
+
     def test_create_session_with_custom_id(self) -> None:
         """Verify session can be created with a custom ID."""
         session = Session(session_id="custom-session-123")
@@ -191,6 +203,43 @@ class TestStateGetSet:
         with pytest.raises(ValueError, match="JSON-serializable"):
             session.set("obj", CustomObject())
 
+    def test_set_nested_non_json_serializable_raises_error(self) -> None:
+        """Verify set() rejects invalid values nested inside containers."""
+        session = Session()
+
+        with pytest.raises(ValueError, match="JSON-serializable"):
+            session.set("data", {"items": [1, 2, {"bad": {1, 2}}]})
+
+        assert session.get("data") is None
+        assert session.get_state_version() == 0
+
+    def test_set_accepts_values_json_dumps_accepts(self) -> None:
+        """Verify tuples and non-string keys are still accepted."""
+        session = Session()
+
+        session.set("pair", (1, 2))
+        session.set("by_id", {1: "one"})
+
+        assert session.get("pair") == (1, 2)
+        assert session.get("by_id") == {1: "one"}
+
+        # Bytes are not JSON values either, despite being immutable
+        with pytest.raises(ValueError, match="JSON-serializable"):
+            session.set("raw", b"data")
+
+    def test_set_atomic_values_recorded(self) -> None:
+        """Verify atomic values are stored and logged like any other value."""
+        session = Session()
+        values = ["text", 42, 3.14, True, None, 2**100]
+
+        for i, value in enumerate(values):
+            session.set(f"k{i}", value)
+
+        for i, value in enumerate(values):
+            assert session.get(f"k{i}") == value
+        entries = session.get_trajectory(entry_type=EntryType.STATE_SET)
+        assert [e.content["new_value"] for e in entries] == values
+
 
 class TestStateVersioning:
     """Tests for state version behavior."""
@@ -316,6 +365,36 @@ class TestStateIsolation:
         assert stored["nested"]["key"] == "value"
         assert stored["list"] == [1, 2, 3]
 
+    def test_deeply_nested_value_is_copied(self) -> None:
+        """Verify values nested more than one level deep are isolated too."""
+        session = Session()
+        original = {"outer": {"inner": {"items": [1, 2]}}, "rows": [[1], [2]]}
+        session.set("data", original)
+
+        original["outer"]["inner"]["items"].append(3)
+        original["rows"][0].append(99)
+        retrieved = session.get("data")
+        retrieved["outer"]["inner"]["items"].clear()
+
+        assert session.get("data") == {"outer": {"inner": {"items": [1, 2]}}, "rows": [[1], [2]]}
+
+    def test_empty_containers_are_copied(self) -> None:
+        """Verify empty dicts and lists are isolated like non-empty ones."""
+        session = Session()
+        original_dict: dict = {}
+        original_list: list = []
+        session.set("d", original_dict)
+        session.set("l", original_list)
+
+        original_dict["leak"] = True
+        original_list.append("leak")
+        session.get("d")["leak"] = True
+        session.get("l").append("leak")
+
+        assert session.get("d") == {}
+        assert session.get("l") == []
+        assert session.get_all_state() == {"d": {}, "l": []}
+
     def test_multiple_gets_return_independent_copies(self) -> None:
         """Verify each get() returns an independent copy."""
         session = Session()
@@ -416,3 +495,24 @@ class TestStateTrajectoryRecording:
         # Second set: old_value should be "first"
         assert state_entries[1].content["old_value"] == "first"
         assert state_entries[1].content["new_value"] == "second"
+
+    def test_set_trajectory_entry_is_isolated(self) -> None:
+        """Verify the STATE_SET entry shares no objects with the caller or state."""
+        session = Session()
+        value = {"items": [1, 2]}
+        session.set("key", value)
+        session.set("key", {"items": [3]})
+
+        # Mutate the caller's value and the value read back from state
+        value["items"].append(99)
+        session.get("key")["items"].append(99)
+
+        entries = session.get_trajectory(entry_type=EntryType.STATE_SET)
+        assert entries[0].content["new_value"] == {"items": [1, 2]}
+        assert entries[1].content["old_value"] == {"items": [1, 2]}
+        assert entries[1].content["new_value"] == {"items": [3]}
+        assert session.get("key") == {"items": [3]}
+
+        # Mutating an entry's content does not reach the state either
+        entries[1].content["new_value"]["items"].append(42)
+        assert session.get("key") == {"items": [3]}
@@ -16,6 +16,7 @@ These tests verify the core invariants:
 - Each entry has a UTC timestamp
 """
 
+import copy
 from datetime import datetime, timezone, timedelta
 
 import pytest
@@ -83,6 +84,28 @@ class TestTrajectoryAppend:
                 content={"func": lambda x: x},  # Not serializable
             )
 
+    def test_append_rejects_cyclic_content(self) -> None:
+        """Verify append() rejects content that refers to itself."""
+        session = Session()
+        content: dict = {"items": []}
+        content["items"].append(content)
+
+        with pytest.raises(ValueError, match="JSON-serializable"):
+            session.append("agent", EntryType.AGENT_COMPLETED, content)
+
+        assert session.get_trajectory_length() == 1
+
+    def test_append_accepts_deeply_nested_content(self) -> None:
+        """Verify content nested deeper than the fast path handles is kept."""
+        session = Session()
+        nested: list = []
+        for _ in range(50):
+            nested = [nested]
+
+        session.append("agent", EntryType.AGENT_COMPLETED, {"nested": nested})
+
+        assert session.get_trajectory()[-1].content == {"nested": nested}
+
     def test_append_stores_copy_of_content(self) -> None:
         """Verify append() stores a copy, not reference."""
         session = Session()
@@ -98,6 +121,52 @@ class TestTrajectoryAppend:
         entry = session.get_trajectory()[-1]
         assert entry.content == {"data": [1, 2, 3]}
 
+    def test_append_content_with_unpicklable_values(self) -> None:
+        """Verify content that is JSON-serializable but not picklable is still copied."""
+
+        class Label(str):  # Local class: serializable by json, not by pickle
+            pass
+
+        session = Session()
+        content = {"labels": [Label("a")], "nested": {"n": 1}}
+
+        session.append("agent", EntryType.AGENT_COMPLETED, content)
+        content["nested"]["n"] = 2
+
+        entry = session.get_trajectory()[-1]
+        assert entry.content == {"labels": ["a"], "nested": {"n": 1}}
+
+    def test_append_many_assigns_consecutive_seq_nums(self) -> None:
+        """Verify append_many() appends every entry in order."""
+        session = Session()
+        start = session.get_trajectory_length() + 1
+
+        seq_nums = session.append_many(
+            ("agent", EntryType.AGENT_COMPLETED, {"n": i}) for i in range(5)
+        )
+
+        assert seq_nums == list(range(start, start + 5))
+        entries = session.get_trajectory(limit=5)
+        assert [e.content["n"] for e in entries] == [0, 1, 2, 3, 4]
+        assert session.is_trajectory_contiguous()
+
+        # Later appends continue the sequence
+        assert session.append("agent", EntryType.AGENT_COMPLETED, {}) == start + 5
+
+    def test_append_many_is_all_or_nothing(self) -> None:
+        """Verify append_many() appends nothing if any entry is invalid."""
+        session = Session()
+        length = session.get_trajectory_length()
+
+        with pytest.raises(ValueError, match="serializable"):
+            session.append_many([
+                ("agent", EntryType.AGENT_COMPLETED, {"ok": True}),
+                ("agent", EntryType.AGENT_COMPLETED, {"func": lambda x: x}),
+            ])
+
+        assert session.get_trajectory_length() == length
+        assert session.append("agent", EntryType.AGENT_COMPLETED, {}) == length + 1
+
 
 class TestTrajectoryRetrieval:
     """Tests for trajectory retrieval operations."""
@@ -187,10 +256,71 @@ class TestTrajectoryRetrieval:
         session.append("agent", EntryType.AGENT_COMPLETED, {"n": 2})
         assert session.get_trajectory_length() == 3
 
+    def test_get_trajectory_filters(self) -> None:
+        """Verify get_trajectory() filters by agent_id and entry_type."""
+        session = Session()
+        session.append("agent_a", EntryType.AGENT_INVOKED, {"n": 1})
+        session.append("agent_b", EntryType.AGENT_INVOKED, {"n": 2})
+        session.append("agent_a", EntryType.AGENT_COMPLETED, {"n": 3})
+
+        by_agent = session.get_trajectory(agent_id="agent_a")
+        assert [e.content["n"] for e in by_agent] == [1, 3]
+
+        by_type = session.get_trajectory(entry_type=EntryType.AGENT_INVOKED)
+        assert [e.content["n"] for e in by_type] == [1, 2]
+
+        both = session.get_trajectory(agent_id="agent_a", entry_type=EntryType.AGENT_INVOKED)
+        assert [e.content["n"] for e in both] == [1]
+
+    def test_get_trajectory_limit_applies_after_filter(self) -> None:
+        """Verify limit returns the most recent matching entries."""
+        session = Session()
+        for n in range(3):
+            session.append("agent", EntryType.AGENT_COMPLETED, {"n": n})
+            session.append("other", EntryType.AGENT_COMPLETED, {"n": n})
+
+        recent = session.get_trajectory(limit=2, agent_id="agent")
+
+        assert [e.content["n"] for e in recent] == [1, 2]
+        assert session.get_trajectory(limit=0, agent_id="agent") == []
+
+    def test_get_trajectory_type_filter_matches_full_scan(self) -> None:
+        """Verify the entry_type filter agrees with filtering the full trajectory."""
+        session = Session()
+        session.append("agent", EntryType.AGENT_INVOKED, {"n": 1})
+        session.append_many([
+            ("agent", EntryType.AGENT_COMPLETED, {"n": 2}),
+            ("agent", EntryType.AGENT_INVOKED, {"n": 3}),
+        ])
+        session.set("key", "value")
+        session.write_artifact("a.txt", b"data")
+
+        all_entries = session.get_trajectory()
+        for entry_type in EntryType:
+            expected = [e for e in all_entries if e.entry_type == entry_type]
+            assert session.get_trajectory(entry_type=entry_type) == expected
+
+        # The returned list is a copy of the index, not the index itself
+        session.get_trajectory(entry_type=EntryType.AGENT_INVOKED).clear()
+        assert len(session.get_trajectory(entry_type=EntryType.AGENT_INVOKED)) == 2
+
 
 class TestTrajectoryOrdering:
     """Tests for trajectory ordering invariants."""
 
+    def test_trajectory_is_contiguous(self) -> None:
+        """Verify is_trajectory_contiguous() reports consecutive seq_nums."""
+        session = Session()
+        assert session.is_trajectory_contiguous()
+
+        for i in range(5):
+            session.append("agent", EntryType.AGENT_COMPLETED, {"n": i})
+        assert session.is_trajectory_contiguous()
+
+        # Simulate a gap such as one left by a corrupted session file
+        del session._trajectory[2]
+        assert not session.is_trajectory_contiguous()
+
     def test_sequence_numbers_start_at_one(self) -> None:
         """Verify sequence numbers are 1-indexed for readability."""
         session = Session()
@@ -251,6 +381,58 @@ class TestTrajectoryImmutability:
         with pytest.raises(AttributeError):
             entry.seq_num = 999  # type: ignore
 
+    def test_deepcopy_isolates_session(self) -> None:
+        """Verify a deep-copied session shares no mutable data with the original."""
+        session = Session()
+        session.set("data", {"items": [1, 2]})
+        session.append("agent", EntryType.AGENT_COMPLETED, {"out": {"n": 1}})
+
+        clone = copy.deepcopy(session)
+        clone.get_trajectory()[-1].content["out"]["n"] = 999
+        clone.set("data", "replaced")
+        clone.append("agent", EntryType.AGENT_COMPLETED, {"out": {"n": 2}})
+
+        assert session.get("data") == {"items": [1, 2]}
+        assert session.get_trajectory()[-1].content == {"out": {"n": 1}}
+        assert session.get_trajectory_length() == 3
+        assert len(clone.get_trajectory(entry_type=EntryType.AGENT_COMPLETED)) == 2
+        assert clone.is_trajectory_contiguous()
+
+    def test_deepcopy_keeps_subclass_attributes(self) -> None:
+        """Verify deep-copying a Session subclass copies its own attributes."""
+
+        class TaggedSession(Session):
+            def __init__(self, **kwargs: object) -> None:
+                super().__init__(**kwargs)
+                self.tags = ["a"]
+
+        session = TaggedSession()
+        clone = copy.deepcopy(session)
+        clone.tags.append("b")
+
+        assert type(clone) is TaggedSession
+        assert session.tags == ["a"]
+        assert clone.tags == ["a", "b"]
+
+    def test_deepcopy_keeps_subclass_slots(self) -> None:
+        """Verify deep-copying a slotted Session subclass copies its slots."""
+
+        class SlottedSession(Session):
+            __slots__ = ("tags",)
+
+        session = SlottedSession()
+        session.tags = ["a"]
+        session.set("data", {"items": [1]})
+
+        clone = copy.deepcopy(session)
+        clone.tags.append("b")
+        clone.get("data")["items"].append(2)
+
+        assert session.tags == ["a"]
+        assert clone.tags == ["a", "b"]
+        assert session.get("data") == {"items": [1]}
+        assert clone.get_trajectory() == session.get_trajectory()
+
     def test_no_delete_method(self) -> None:
         """Verify there's no way to delete trajectory entries."""
         session = Session()
@@ -16,6 +16,7 @@ Tests verify:
 5. Factory methods work correctly
 """
 
+import dataclasses
 from datetime import datetime, timezone, timedelta
 import pytest
 
@@ -165,6 +166,24 @@ class TestTrajectoryEntry:
         with pytest.raises(AttributeError):
             valid_entry.content = {}  # type: ignore
 
+    def test_agent_id_is_interned(self) -> None:
+        """Verify entries with equal agent_ids share one string object."""
+        # Build the ID at runtime so it is not a compile-time constant
+        agent_id = "".join(["dynamic", "_agent"])
+        entries = [
+            TrajectoryEntry(
+                seq_num=n,
+                timestamp=datetime.now(timezone.utc),
+                agent_id="".join(["dynamic", "_agent"]),
+                entry_type=EntryType.AGENT_COMPLETED,
+                content={},
+            )
+            for n in (1, 2)
+        ]
+
+        assert entries[0].agent_id is entries[1].agent_id
+        assert entries[0].agent_id == agent_id
+
     def test_seq_num_must_be_positive(self) -> None:
         """Verify seq_num validation rejects non-positive values."""
         with pytest.raises(ValueError, match="seq_num must be >= 1"):
@@ -235,6 +254,42 @@ class TestTrajectoryEntry:
         assert isinstance(data["timestamp"], str)
         assert "T" in data["timestamp"]  # ISO format contains T
 
+    def test_to_dict_returns_new_dict_each_call(self, valid_entry: TrajectoryEntry) -> None:
+        """Verify mutating one to_dict() result does not affect later calls."""
+        first = valid_entry.to_dict()
+        first["seq_num"] = 999
+        first["new_key"] = "value"
+
+        second = valid_entry.to_dict()
+        assert second["seq_num"] == 1
+        assert "new_key" not in second
+
+    def test_to_dict_cache_is_not_a_field(self, valid_entry: TrajectoryEntry) -> None:
+        """Verify the cached to_dict() result stays out of the dataclass fields."""
+        valid_entry.to_dict()
+
+        assert [f.name for f in dataclasses.fields(valid_entry)] == [
+            "seq_num", "timestamp", "agent_id", "entry_type", "content",
+        ]
+        assert set(dataclasses.asdict(valid_entry)) == {
+            "seq_num", "timestamp", "agent_id", "entry_type", "content",
+        }
+        replaced = dataclasses.replace(valid_entry, seq_num=2)
+        assert replaced.to_dict()["seq_num"] == 2
+
+    def test_from_dict_rejects_unknown_entry_type(self) -> None:
+        """Verify from_dict raises ValueError for an unknown entry type."""
+        data = {
+            "seq_num": 1,
+            "timestamp": datetime.now(timezone.utc).isoformat(),
+            "agent_id": "agent",
+            "entry_type": "not_a_type",
+            "content": {},
+        }
+
+        with pytest.raises(ValueError):
+            TrajectoryEntry.from_dict(data)
+
     def test_from_dict_deserialization(self) -> None:
         """Verify from_dict correctly reconstructs an entry."""
         timestamp = datetime.now(timezone.utc)
@@ -501,6 +556,13 @@ class TestCapabilityCall:
         assert data["capability"] == "transform"
         assert data["params"] == {"input": "hello"}
 
+    def test_to_dict_cache_is_not_a_field(self) -> None:
+        """Verify the cached to_dict() result stays out of the dataclass fields."""
+        call = CapabilityCall(capability="reverse", params={"key": "text"})
+        call.to_dict()
+
+        assert dataclasses.asdict(call) == {"capability": "reverse", "params": {"key": "text"}}
+
     def test_from_dict_with_params(self) -> None:
         """Verify from_dict correctly creates call with params."""
         data = {
@@ -522,6 +584,19 @@ class TestCapabilityCall:
         assert call.capability == "status"
         assert call.params == {}
 
+    def test_from_dict_with_null_params(self) -> None:
+        """Verify from_dict treats null params as no parameters."""
+        call = CapabilityCall.from_dict({"capability": "status", "params": None})
+
+        assert call.params == {}
+
+    def test_from_dict_keeps_falsy_params(self) -> None:
+        """Verify from_dict does not turn other falsy params into {}."""
+        for params in ([], "", 0, False):
+            call = CapabilityCall.from_dict({"capability": "status", "params": params})
+
+            assert call.params is params
+
     def test_roundtrip_serialization(self) -> None:
         """Verify to_dict -> from_dict preserves data."""
         original = CapabilityCall(
@@ -629,3 +704,29 @@ class TestAgentInfo:
         assert data["version"] == "2.0.0"
         assert data["capabilities"] == ["a", "b"]
         assert data["description"] == "Does testing"
+
+    def test_to_dict_returns_new_dict_each_call(self) -> None:
+        """Verify mutating one to_dict() result does not affect later calls."""
+        info = AgentInfo(
+            agent_id="test_id",
+            name="Test Agent",
+            version="2.0.0",
+            capabilities=["a"],
+        )
+
+        info.to_dict()["name"] = "changed"
+
+        assert info.to_dict()["name"] == "Test Agent"
+        assert info == AgentInfo("test_id", "Test Agent", "2.0.0", ["a"])
+
+    def test_private_caches_are_not_fields(self) -> None:
+        """Verify cached values stay out of the dataclass fields."""
+        info = AgentInfo(
+            agent_id="test_id",
+            name="Test Agent",
+            version="2.0.0",
+            capabilities=["a"],
+        )
+        info.to_dict()
+
+        assert dataclasses.asdict(info) == info.to_dict()